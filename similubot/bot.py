@@ -24,6 +24,7 @@ from similubot.uploaders.catbox_uploader import CatboxUploader
 from similubot.uploaders.discord_uploader import DiscordUploader
 from similubot.generators.image_generator import ImageGenerator
 from similubot.music.music_player import MusicPlayer
+from similubot.music._http import close_shared_session
 from similubot.utils.config_manager import ConfigManager
 from similubot.auth.authorization_manager import AuthorizationManager
 from similubot.auth.unauthorized_handler import UnauthorizedAccessHandler
@@ -278,6 +279,9 @@ class SimiluBot:
             if hasattr(self, 'music_player'):
                 await self.music_player.cleanup_all()
 
+            # Close the shared HTTP session used by music clients
+            await close_shared_session()
+
             # Send shutdown notification if configured
             # await self.event_handler.send_shutdown_notification(channel_id)
 
@@ -574,9 +574,7 @@ class MusicCommands:
             # Parse the time for display purposes
             seek_result = self.music_player.seek_manager.parse_seek_time(time_str)
             if seek_result.success and seek_result.target_position is not None:
-                is_relative = self.music_player.seek_manager.is_relative_seek(time_str)
-
-                if is_relative:
+                if seek_result.is_relative:
                     # For relative seeks, show the direction
                     direction = "forward" if seek_result.target_position >= 0 else "backward"
                     formatted_time = self.music_player.seek_manager.format_time(abs(seek_result.target_position))
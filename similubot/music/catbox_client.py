@@ -8,18 +8,82 @@ detection measures.
 """
 
 import logging
+import random
 import re
 import asyncio
 import aiohttp
 import time
-from typing import Optional, Tuple, Dict, Any
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import ClassVar, FrozenSet, List, Mapping, NamedTuple, Optional, Tuple, Dict, Any
 from dataclasses import dataclass
 from urllib.parse import urlparse
 import os
 
+from similubot.music._http import USER_AGENT, get_shared_session
 from similubot.progress.base import ProgressTracker, ProgressInfo, ProgressStatus, ProgressCallback
 
 
+# Unit table for human-readable file sizes, indexed by binary magnitude
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Module-level loggers - getLogger takes the logging manager lock, so hoist
+# the lookups out of the per-instance constructors
+_LOG = logging.getLogger("similubot.music.catbox_client")
+_PROG_LOG = logging.getLogger("similubot.progress.catbox")
+
+
+class _ParsedCatboxUrl(NamedTuple):
+    """Result of parsing a Catbox URL once for all validation/metadata needs."""
+    valid: bool
+    filename: str
+    ext: Optional[str]
+
+
+@lru_cache(maxsize=1024)
+def _parse_url(url: str) -> _ParsedCatboxUrl:
+    """
+    Parse a Catbox URL once, extracting validity, filename and extension.
+
+    Fuses the work previously done separately by URL validation, filename
+    extraction and format detection into a single cached ``urlparse`` call.
+
+    Args:
+        url: URL to parse
+
+    Returns:
+        _ParsedCatboxUrl with validity flag, filename (without extension)
+        and lowercase file extension (or None)
+    """
+    # Fast path: the compiled regex matches the exact Catbox grammar and
+    # avoids urlparse's general-purpose tokenization for valid URLs.
+    match = CatboxClient._CATBOX_RE.match(url)
+    if match:
+        return _ParsedCatboxUrl(
+            valid=True,
+            filename=match.group(1),
+            ext=match.group(2).lower()
+        )
+
+    # Slow path: not a valid Catbox audio URL, but still extract
+    # best-effort filename/extension for callers that want them.
+    try:
+        parsed = urlparse(url)
+
+        basename = os.path.basename(parsed.path)
+        stem, dot, ext = basename.rpartition('.')
+        if not dot:
+            # No extension - keep the raw basename as the filename
+            stem, ext_lower = basename, None
+        else:
+            ext_lower = ext.lower()
+
+        return _ParsedCatboxUrl(valid=False, filename=stem, ext=ext_lower)
+    except Exception:
+        return _ParsedCatboxUrl(valid=False, filename="Unknown Audio File", ext=None)
+
+
 class CatboxProgressTracker(ProgressTracker):
     """
     Progress tracker for Catbox audio file processing.
@@ -30,7 +94,7 @@ class CatboxProgressTracker(ProgressTracker):
     def __init__(self):
         """Initialize the Catbox progress tracker."""
         super().__init__("Catbox Audio Processing")
-        self.logger = logging.getLogger("similubot.progress.catbox")
+        self.logger = _PROG_LOG
 
     def parse_output(self, output_line: str) -> bool:
         """
@@ -45,9 +109,42 @@ class CatboxProgressTracker(ProgressTracker):
         return False
 
 
-@dataclass
+class _NullProgressTracker(CatboxProgressTracker):
+    """
+    No-op progress tracker used when no callback is attached.
+
+    Skips ProgressInfo construction and callback dispatch entirely, so
+    internal/automated validations pay no tracking overhead.
+    """
+
+    def start(self) -> None:
+        pass
+
+    def update(self, *args, **kwargs) -> None:
+        pass
+
+    def complete(self, message: Optional[str] = None) -> None:
+        pass
+
+    def fail(self, error_message: str) -> None:
+        pass
+
+    def cancel(self, message: Optional[str] = None) -> None:
+        pass
+
+
+# Shared stateless singleton - safe because every method is a no-op
+_NULL_TRACKER = _NullProgressTracker()
+
+
+@dataclass(slots=True)
 class CatboxAudioInfo:
-    """Information about a Catbox audio file."""
+    """
+    Information about a Catbox audio file.
+
+    Slotted to drop the per-instance __dict__; long queues hold many of
+    these for the lifetime of the bot.
+    """
     title: str
     duration: int  # Duration in seconds (estimated or 0 if unknown)
     file_path: str  # URL for streaming
@@ -66,71 +163,65 @@ class CatboxClient:
     for audio files hosted on Catbox.
     """
 
-    # Supported audio formats
-    SUPPORTED_FORMATS = {
+    # Supported audio formats (immutable, safe to share across instances)
+    SUPPORTED_FORMATS: ClassVar[FrozenSet[str]] = frozenset({
         'mp3', 'wav', 'ogg', 'm4a', 'flac', 'aac', 'opus', 'wma'
-    }
-
-    # User-Agent string to mimic a real browser and avoid anti-bot measures
-    # Using Chrome on Windows 10 - one of the most common browser/OS combinations
-    USER_AGENT = (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    })
+
+    # Precompiled fast-path matcher for valid Catbox audio URLs.
+    # Captures the filename stem and extension in one pass so no
+    # separate urlparse call is needed for valid URLs.
+    _CATBOX_RE = re.compile(
+        r'^https?://files\.catbox\.moe/([^/?#]+)'
+        r'\.(mp3|wav|ogg|m4a|flac|aac|opus|wma)(?:[?#].*)?$',
+        re.IGNORECASE
     )
 
-    def __init__(self, temp_dir: str = "./temp"):
+    # User-Agent string shared by all music HTTP clients (see similubot.music._http)
+    USER_AGENT = USER_AGENT
+
+    def __init__(self, temp_dir: str = "./temp", max_bytes: int = 500 * 1024 * 1024):
         """
         Initialize the Catbox client.
 
         Args:
             temp_dir: Directory for temporary files (not used for streaming)
+            max_bytes: Maximum file size accepted for streaming (default 500 MB)
         """
-        self.logger = logging.getLogger("similubot.music.catbox_client")
+        self.logger = _LOG
         self.temp_dir = temp_dir
+        self.max_bytes = max_bytes
 
-        # HTTP session for requests
-        self._session: Optional[aiohttp.ClientSession] = None
+        # Small LRU cache of successful validations so re-queueing the same
+        # link within the TTL costs zero round trips
+        self._info_cache: "OrderedDict[str, Tuple[float, CatboxAudioInfo]]" = OrderedDict()
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """
-        Get or create HTTP session with browser-like headers.
+        Get the application-wide HTTP session with browser-like headers.
 
         Returns:
             aiohttp ClientSession configured with realistic headers
         """
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=30, connect=10)
-
-            # Headers to make requests appear more browser-like
-            headers = {
-                'User-Agent': self.USER_AGENT,
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',  # Do Not Track
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Cache-Control': 'max-age=0'
-            }
-
-            self._session = aiohttp.ClientSession(
-                timeout=timeout,
-                headers=headers,
-                connector=aiohttp.TCPConnector(
-                    limit=10,  # Connection pool limit
-                    limit_per_host=5,  # Per-host connection limit
-                    ttl_dns_cache=300,  # DNS cache TTL
-                    use_dns_cache=True,
-                )
-            )
+        return await get_shared_session()
 
-            self.logger.debug(f"Created HTTP session with User-Agent: {self.USER_AGENT}")
-        return self._session
+    # Lowercase extension suffixes for a C-level endswith pre-filter
+    _EXT_TUPLE = tuple('.' + ext for ext in sorted(SUPPORTED_FORMATS))
 
-    def _get_request_headers(self, url: str) -> Dict[str, str]:
+    # TTL and size cap for the per-client validation result cache
+    _INFO_CACHE_TTL = 300.0  # seconds
+    _INFO_CACHE_MAX = 256
+
+    # Additional per-request headers are constant, so build the mapping once
+    # at class scope instead of allocating a fresh dict per HEAD request
+    _REQUEST_HEADERS = MappingProxyType({
+        'Referer': 'https://catbox.moe/',  # Make it look like we came from the main site
+        'Origin': 'https://catbox.moe',
+        'Sec-Fetch-User': '?1',
+        'Pragma': 'no-cache',
+    })
+
+    def _get_request_headers(self, url: str) -> Mapping[str, str]:
         """
         Get additional headers for specific requests to make them more browser-like.
 
@@ -138,51 +229,97 @@ class CatboxClient:
             url: The URL being requested
 
         Returns:
-            Dictionary of additional headers
+            Read-only mapping of additional headers
         """
-        return {
-            'Referer': 'https://catbox.moe/',  # Make it look like we came from the main site
-            'Origin': 'https://catbox.moe',
-            'Sec-Fetch-User': '?1',
-            'Pragma': 'no-cache',
-        }
-
-    async def _make_head_request_with_retry(self, url: str, max_retries: int = 2) -> Optional[aiohttp.ClientResponse]:
+        return self._REQUEST_HEADERS
+
+    async def _make_head_request_with_retry(self, url: str, max_retries: int = 2) -> Optional[Tuple[int, Any]]:
         """
         Make a HEAD request with retry logic for better reliability.
 
+        The status and headers are read while the response is still open and
+        returned as plain data, so the connection is released back to the
+        pool immediately instead of leaking out of the response context.
+
         Args:
             url: URL to request
             max_retries: Maximum number of retry attempts
 
         Returns:
-            Response object if successful, None if all retries failed
+            Tuple of (status, headers) if successful, None if all retries failed
         """
         session = await self._get_session()
         additional_headers = self._get_request_headers(url)
 
         for attempt in range(max_retries + 1):
             try:
-                self.logger.debug(f"HEAD request attempt {attempt + 1}/{max_retries + 1} to {url}")
-
-                async with session.head(url, headers=additional_headers) as response:
-                    self.logger.debug(f"Response: HTTP {response.status}")
-
-                    # Return response for any status - let caller handle status codes
-                    return response
-
+                self.logger.debug("HEAD request attempt %d/%d to %s", attempt + 1, max_retries + 1, url)
+
+                response = await session.head(url, headers=additional_headers)
+                try:
+                    status = response.status
+                    headers = response.headers
+                    self.logger.debug("Response: HTTP %s", status)
+
+                    if status == 429 and attempt < max_retries:
+                        # Rate limited - honor Retry-After if the server sent one
+                        wait_time = self._retry_wait_time(attempt, headers.get('Retry-After'))
+                        self.logger.debug("HTTP 429, waiting %.1fs before retry...", wait_time)
+                        await asyncio.sleep(wait_time)
+                        continue
+
+                    # Return data for any other status - let caller handle status codes
+                    return status, headers
+                finally:
+                    response.release()
+
+            except aiohttp.ClientResponseError as e:
+                # Non-429 4xx errors are unrecoverable - retrying won't help
+                self.logger.warning(f"Request attempt {attempt + 1} failed: {e}")
+                if 400 <= e.status < 500 and e.status != 429:
+                    return None
+                if attempt < max_retries:
+                    wait_time = self._retry_wait_time(attempt)
+                    self.logger.debug("Waiting %.1fs before retry...", wait_time)
+                    await asyncio.sleep(wait_time)
+                else:
+                    self.logger.error(f"All {max_retries + 1} attempts failed for {url}")
             except aiohttp.ClientError as e:
                 self.logger.warning(f"Request attempt {attempt + 1} failed: {e}")
                 if attempt < max_retries:
-                    # Wait a bit before retrying (exponential backoff)
-                    wait_time = 2 ** attempt
-                    self.logger.debug(f"Waiting {wait_time}s before retry...")
+                    # Exponential backoff with jitter to avoid synchronized
+                    # retry storms across concurrent validations
+                    wait_time = self._retry_wait_time(attempt)
+                    self.logger.debug("Waiting %.1fs before retry...", wait_time)
                     await asyncio.sleep(wait_time)
                 else:
                     self.logger.error(f"All {max_retries + 1} attempts failed for {url}")
 
         return None
 
+    @staticmethod
+    def _retry_wait_time(attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Compute the backoff delay for a retry attempt.
+
+        Uses exponential backoff with multiplicative jitter (0.5-1.5x) capped
+        at 30 seconds, so concurrent clients don't retry in lockstep. A valid
+        Retry-After header value takes precedence over the formula.
+
+        Args:
+            attempt: Zero-based retry attempt number
+            retry_after: Optional Retry-After header value in seconds
+
+        Returns:
+            Delay in seconds before the next attempt
+        """
+        if retry_after:
+            try:
+                return min(30.0, float(retry_after))
+            except ValueError:
+                pass
+        return min(30.0, (2 ** attempt) * (0.5 + random.random()))
+
     def is_catbox_url(self, url: str) -> bool:
         """
         Check if a URL is a valid Catbox audio file URL.
@@ -193,28 +330,12 @@ class CatboxClient:
         Returns:
             True if valid Catbox audio URL, False otherwise
         """
-        try:
-            # Parse URL
-            parsed = urlparse(url)
-
-            # Check domain
-            if parsed.netloc.lower() != 'files.catbox.moe':
-                return False
-
-            # Check if it has a file extension
-            path = parsed.path.lower()
-            if not path or '.' not in path:
-                return False
-
-            # Extract file extension
-            file_extension = path.split('.')[-1]
-
-            # Check if it's a supported audio format
-            return file_extension in self.SUPPORTED_FORMATS
-
-        except Exception as e:
-            self.logger.debug(f"Error parsing URL {url}: {e}")
+        # Cheap endswith pre-filter: anything without a supported audio
+        # extension (and no query/fragment that could hide one) can be
+        # rejected without touching the parser or its cache
+        if not url.lower().endswith(self._EXT_TUPLE) and '?' not in url and '#' not in url:
             return False
+        return _parse_url(url).valid
 
     def _extract_filename_from_url(self, url: str) -> str:
         """
@@ -226,16 +347,7 @@ class CatboxClient:
         Returns:
             Filename without extension
         """
-        try:
-            parsed = urlparse(url)
-            filename = os.path.basename(parsed.path)
-
-            # Remove extension for title
-            if '.' in filename:
-                return "Catbox - " + filename.rsplit('.', 1)[0]
-            return "Catbox - " + filename
-        except Exception:
-            return "Unknown Audio File"
+        return _parse_url(url).filename
 
     def _get_file_format_from_url(self, url: str) -> Optional[str]:
         """
@@ -247,14 +359,37 @@ class CatboxClient:
         Returns:
             File format (extension) or None
         """
-        try:
-            parsed = urlparse(url)
-            path = parsed.path.lower()
-            if '.' in path:
-                return path.split('.')[-1]
-        except Exception:
-            pass
-        return None
+        return _parse_url(url).ext
+
+    @staticmethod
+    def _build_audio_info(url: str, parsed: _ParsedCatboxUrl, headers: Any) -> CatboxAudioInfo:
+        """
+        Build a CatboxAudioInfo from an already-parsed URL and HEAD headers.
+
+        Pure synchronous computation - keeps the network-facing coroutine
+        down to a single await on the HEAD request.
+
+        Args:
+            url: Catbox URL
+            parsed: Cached parse result for the URL
+            headers: Response headers from the HEAD request
+
+        Returns:
+            CatboxAudioInfo describing the file
+        """
+        content_length = headers.get('content-length')
+        file_size = int(content_length) if content_length else None
+
+        return CatboxAudioInfo(
+            title=parsed.filename,
+            duration=0,  # Cannot determine duration without downloading
+            file_path=url,  # Use URL directly for streaming
+            url=url,
+            uploader="Catbox",
+            file_size=file_size,
+            file_format=parsed.ext,
+            thumbnail_url=None
+        )
 
     async def extract_audio_info(self, url: str) -> Optional[CatboxAudioInfo]:
         """
@@ -266,47 +401,51 @@ class CatboxClient:
         Returns:
             CatboxAudioInfo object if successful, None otherwise
         """
-        if not self.is_catbox_url(url):
+        parsed = _parse_url(url)
+        if not parsed.valid:
             self.logger.error(f"Invalid Catbox URL: {url}")
             return None
 
+        # Serve repeat lookups from the TTL cache (successful results only)
+        cached = self._info_cache.get(url)
+        if cached:
+            timestamp, info = cached
+            if time.time() - timestamp < self._INFO_CACHE_TTL:
+                self._info_cache.move_to_end(url)
+                self.logger.debug("Catbox info cache hit for %s", url)
+                return info
+            del self._info_cache[url]
+
         try:
             self.logger.debug(f"Extracting info from Catbox URL: {url}")
 
             # Use retry logic for better reliability
-            response = await self._make_head_request_with_retry(url)
-            if not response:
+            result = await self._make_head_request_with_retry(url)
+            if not result:
                 self.logger.error(f"Failed to get response from Catbox URL after retries: {url}")
                 return None
 
-            self.logger.debug(f"Response status: {response.status}, headers: {dict(response.headers)}")
+            status, headers = result
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Response status: %s, headers: %s", status, headers)
 
-            if response.status != 200:
-                self.logger.error(f"Catbox file not accessible: {url} (HTTP {response.status})")
-                if response.status == 403:
+            if status != 200:
+                self.logger.error(f"Catbox file not accessible: {url} (HTTP {status})")
+                if status == 403:
                     self.logger.warning("HTTP 403 - Possible anti-bot detection despite User-Agent spoofing")
-                elif response.status == 429:
+                elif status == 429:
                     self.logger.warning("HTTP 429 - Rate limited by Catbox servers")
                 return None
 
-            # Extract metadata from headers
-            content_length = response.headers.get('content-length')
-            file_size = int(content_length) if content_length else None
-
-            # Extract filename and format
-            filename = self._extract_filename_from_url(url)
-            file_format = self._get_file_format_from_url(url)
-
-            return CatboxAudioInfo(
-                title=filename,
-                duration=0,  # Cannot determine duration without downloading
-                file_path=url,  # Use URL directly for streaming
-                url=url,
-                uploader="Catbox",
-                file_size=file_size,
-                file_format=file_format,
-                thumbnail_url=None
-            )
+            audio_info = self._build_audio_info(url, parsed, headers)
+
+            # Cache the successful result with LRU eviction
+            self._info_cache[url] = (time.time(), audio_info)
+            self._info_cache.move_to_end(url)
+            if len(self._info_cache) > self._INFO_CACHE_MAX:
+                self._info_cache.popitem(last=False)
+
+            return audio_info
 
         except aiohttp.ClientError as e:
             self.logger.error(f"Network error accessing Catbox URL {url}: {e}")
@@ -330,58 +469,40 @@ class CatboxClient:
         Returns:
             Tuple of (success, CatboxAudioInfo, error_message)
         """
-        if not self.is_catbox_url(url):
+        if not _parse_url(url).valid:
             return False, None, f"Invalid Catbox URL: {url}"
 
-        # Initialize progress tracker
-        progress_tracker = CatboxProgressTracker()
+        # Initialize progress tracker (no-op singleton when nobody listens)
         if progress_callback:
+            progress_tracker = CatboxProgressTracker()
             progress_tracker.add_callback(progress_callback)
+        else:
+            progress_tracker = _NULL_TRACKER
 
         try:
             self.logger.info(f"Validating Catbox audio file: {url}")
             
-            # Start progress tracking
+            # Start progress tracking - the single HEAD is sub-second, so go
+            # straight from start to the terminal state without intermediate
+            # percentage updates (each one may trigger a Discord edit)
             progress_tracker.start()
-            progress_tracker.update(
-                percentage=25.0,
-                message="Validating Catbox URL..."
-            )
 
-            # Extract audio info
+            # Extract audio info - the HEAD request inside already proved the
+            # file is accessible (HTTP 200), so no second request is needed
             audio_info = await self.extract_audio_info(url)
             if not audio_info:
                 progress_tracker.fail("Failed to extract audio information")
                 return False, None, "Failed to extract audio information from Catbox URL"
 
-            progress_tracker.update(
-                percentage=75.0,
-                message="Checking file accessibility..."
-            )
-
-            # Verify file is accessible with browser-like headers and retry logic
-            self.logger.debug(f"Validating Catbox file accessibility: {url}")
-            response = await self._make_head_request_with_retry(url)
-            if not response:
-                error_msg = "Failed to connect to Catbox server after retries"
-                progress_tracker.fail(error_msg)
-                return False, None, error_msg
-
-            self.logger.debug(f"Validation response status: {response.status}")
-
-            if response.status != 200:
-                error_msg = f"Catbox file not accessible (HTTP {response.status})"
-                if response.status == 403:
-                    error_msg += " - Possible anti-bot detection"
-                    self.logger.warning("HTTP 403 during validation - anti-bot measures may be active")
-                elif response.status == 429:
-                    error_msg += " - Rate limited"
-                    self.logger.warning("HTTP 429 during validation - rate limited by server")
-                elif response.status == 404:
-                    error_msg += " - File not found"
-
+            # Bail early on oversized files before any streaming/ffmpeg work
+            if audio_info.file_size and audio_info.file_size > self.max_bytes:
+                error_msg = (
+                    f"File too large: {self.format_file_size(audio_info.file_size)} "
+                    f"(limit {self.format_file_size(self.max_bytes)})"
+                )
+                self.logger.warning(f"Rejecting oversized Catbox file {url}: {error_msg}")
                 progress_tracker.fail(error_msg)
-                return False, None, error_msg
+                return False, audio_info, error_msg
 
             # Complete progress tracking
             file_size_mb = audio_info.file_size / (1024 * 1024) if audio_info.file_size else 0
@@ -398,6 +519,48 @@ class CatboxClient:
             progress_tracker.fail(error_msg)
             return False, None, error_msg
 
+    async def validate_audio_files(
+        self,
+        urls: List[str],
+        concurrency: int = 8
+    ) -> List[Tuple[bool, Optional[CatboxAudioInfo], Optional[str]]]:
+        """
+        Validate multiple Catbox audio file URLs concurrently.
+
+        Runs the per-URL HEAD requests in parallel under a bounded semaphore
+        so a playlist of N links completes in roughly one round trip instead
+        of N sequential ones.
+
+        Args:
+            urls: Catbox URLs to validate
+            concurrency: Maximum number of validations in flight at once
+
+        Returns:
+            List of (success, CatboxAudioInfo, error_message) tuples in the
+            same order as the input URLs
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def validate_one(url: str) -> Tuple[bool, Optional[CatboxAudioInfo], Optional[str]]:
+            async with semaphore:
+                return await self.validate_audio_file(url)
+
+        results = await asyncio.gather(
+            *(validate_one(url) for url in urls),
+            return_exceptions=True
+        )
+
+        # Convert unexpected exceptions into error tuples so one bad URL
+        # doesn't take down the whole batch
+        output: List[Tuple[bool, Optional[CatboxAudioInfo], Optional[str]]] = []
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                self.logger.error(f"Error validating Catbox URL {url}: {result}")
+                output.append((False, None, f"Error validating Catbox URL {url}: {result}"))
+            else:
+                output.append(result)
+        return output
+
     def format_file_size(self, size_bytes: Optional[int]) -> str:
         """
         Format file size in bytes to human-readable format.
@@ -410,18 +573,19 @@ class CatboxClient:
         """
         if not size_bytes:
             return "Unknown size"
-        
-        if size_bytes < 1024:
+
+        # Index the unit table by the size's binary magnitude (1024 == 2**10)
+        # instead of walking a chain of comparisons
+        i = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        if i == 0:
             return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+        return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
     async def cleanup(self) -> None:
-        """Clean up HTTP session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self.logger.debug("Catbox client session closed")
+        """
+        Clean up client resources.
+
+        The HTTP session is shared application-wide and closed once at bot
+        shutdown (see similubot.music._http), so there is nothing to do here.
+        """
+        pass
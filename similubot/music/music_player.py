@@ -1,10 +1,15 @@
 """Core music player for SimiluBot."""
 
+import heapq
 import logging
 import asyncio
 import os
+import re
 import time
-from typing import Optional, Dict, Callable, Any
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Optional, Dict, Callable, Any, List, Tuple
 import discord
 from discord.ext import commands
 
@@ -14,9 +19,72 @@ from .audio_source import UnifiedAudioInfo, AudioSourceType
 from .queue_manager import QueueManager, Song
 from .voice_manager import VoiceManager
 from .seek_manager import SeekManager, SeekResult
+from ._http import STREAMING_TIMEOUT, get_shared_session
 from similubot.progress.base import ProgressCallback
 from similubot.utils.config_manager import ConfigManager
 
+# Matches the supported YouTube URL shapes and captures the video ID so
+# equivalent URLs (watch/embed/short links, tracking params) share one
+# canonical cache key
+_YOUTUBE_ID_RE = re.compile(
+    r'(?:https?://)?(?:www\.|m\.)?(?:youtube\.com/(?:watch\?(?:[^#]*&)?v=|embed/|v/)|youtu\.be/)([\w-]+)'
+)
+
+# Single-pass domain classifier for URL dispatch: one alternation regex
+# narrows a URL to at most one candidate client, whose own check then
+# validates the full URL shape (playlists, supported extensions, ...).
+# Non-matching URLs are rejected without calling either client.
+_URL_CLASSIFIER = re.compile(
+    r'^(?:(?P<yt>(?:https?://)?(?:www\.)?(?:youtube\.com|youtu\.be)/)'
+    r'|(?P<cb>https?://files\.catbox\.moe/))',
+    re.IGNORECASE
+)
+
+
+@dataclass(slots=True)
+class GuildState:
+    """
+    All per-guild playback state in one slotted object.
+
+    Replaces the previous fan-out of parallel Dict[int, X] attributes, so
+    every operation hashes the guild ID once, cleanup can't forget a field,
+    and attribute access goes through cheap slot descriptors.
+    """
+    queue_manager: QueueManager
+    playback_task: Optional[asyncio.Task] = None
+    audio_file: Optional[str] = None
+    is_local_file: bool = False  # computed once when audio_file is set
+    start_time: float = 0.0  # 0.0 means timing not active
+    pause_start: float = 0.0  # 0.0 means not currently paused
+    paused_total: float = 0.0
+    inactivity_timer: Optional[asyncio.Task] = None  # in-flight auto-disconnect
+    expiry_deadline: float = 0.0  # 0.0 means no inactivity deadline armed
+    last_activity: float = 0.0
+    prefetch_task: Optional[asyncio.Task] = None
+    prefetched: Optional[Tuple[str, str]] = None  # (song URL, resolved audio path)
+    stream_task: Optional[asyncio.Task] = None  # pumps HTTP audio into ffmpeg stdin
+
+
+@lru_cache(maxsize=4096)
+def _canonical_url(url: str) -> str:
+    """
+    Canonicalize an audio URL for metadata-cache lookups.
+
+    YouTube URLs collapse to ``https://youtu.be/<video_id>`` regardless of
+    the original form or tracking parameters; other URLs pass through
+    unchanged.
+
+    Args:
+        url: Audio URL
+
+    Returns:
+        Canonical cache key for the URL
+    """
+    match = _YOUTUBE_ID_RE.match(url)
+    if match:
+        return f"https://youtu.be/{match.group(1)}"
+    return url
+
 
 class MusicPlayer:
     """
@@ -24,6 +92,11 @@ class MusicPlayer:
     and Discord voice playback.
     """
 
+    # TTL and size cap for the audio-metadata cache (repeat queueing of the
+    # same URL skips the network round trip entirely)
+    _INFO_TTL = 86400.0  # seconds
+    _INFO_MAX = 2000
+
     def __init__(self, bot: commands.Bot, temp_dir: str = "./temp", config: Optional[ConfigManager] = None):
         """
         Initialize the music player.
@@ -38,30 +111,54 @@ class MusicPlayer:
         self.temp_dir = temp_dir
         self.config = config
 
+        # Monotonic clock for all playback timing: immune to NTP wall-clock
+        # jumps, so elapsed deltas can never go negative. Positions derived
+        # from it are monotonic deltas, not epoch times.
+        self._clock = time.monotonic
+
         # Initialize components with config support
         self.youtube_client = YouTubeClient(temp_dir, config)
         self.catbox_client = CatboxClient(temp_dir)
         self.voice_manager = VoiceManager(bot)
         self.seek_manager = SeekManager()
 
-        # Guild-specific queue managers
-        self._queue_managers: Dict[int, QueueManager] = {}
+        # All per-guild playback state, one GuildState per guild
+        self._guilds: Dict[int, GuildState] = {}
 
-        # Playback state tracking
-        self._playback_tasks: Dict[int, asyncio.Task] = {}
-        self._current_audio_files: Dict[int, str] = {}
+        # Metadata cache keyed by canonical URL (LRU with TTL)
+        self._info_cache: "OrderedDict[str, Tuple[float, UnifiedAudioInfo]]" = OrderedDict()
 
-        # Playback timing tracking
-        self._playback_start_times: Dict[int, float] = {}
-        self._playback_paused_times: Dict[int, float] = {}
-        self._total_paused_duration: Dict[int, float] = {}
+        # Temp-file deletion queue and its janitor task, created lazily on
+        # first use (no event loop is running at construction time)
+        self._deletion_queue: Optional["asyncio.Queue[str]"] = None
+        self._janitor_task: Optional[asyncio.Task] = None
 
-        # Auto-disconnect inactivity tracking
-        self._inactivity_timers: Dict[int, asyncio.Task] = {}
-        self._last_activity_times: Dict[int, float] = {}
+        # Shared inactivity scheduler: one heap of (deadline, guild_id)
+        # entries and a single TimerHandle armed for the earliest one,
+        # instead of a parked sleep task per guild
+        self._expiry_heap: List[Tuple[float, int]] = []
+        self._expiry_handle: Optional[asyncio.TimerHandle] = None
 
         self.logger.info("Music player initialized")
 
+    def _get_state(self, guild_id: int) -> GuildState:
+        """
+        Get or create the playback state for a guild.
+
+        Args:
+            guild_id: Discord guild ID
+
+        Returns:
+            GuildState instance
+        """
+        state = self._guilds.get(guild_id)
+        if state is None:
+            state = GuildState(queue_manager=QueueManager(guild_id))
+            self._guilds[guild_id] = state
+            self.logger.debug(f"Created playback state for guild {guild_id}")
+
+        return state
+
     def get_queue_manager(self, guild_id: int) -> QueueManager:
         """
         Get or create a queue manager for a guild.
@@ -72,11 +169,7 @@ class MusicPlayer:
         Returns:
             QueueManager instance
         """
-        if guild_id not in self._queue_managers:
-            self._queue_managers[guild_id] = QueueManager(guild_id)
-            self.logger.debug(f"Created queue manager for guild {guild_id}")
-
-        return self._queue_managers[guild_id]
+        return self._get_state(guild_id).queue_manager
 
     def detect_audio_source_type(self, url: str) -> Optional[AudioSourceType]:
         """
@@ -88,12 +181,12 @@ class MusicPlayer:
         Returns:
             AudioSourceType if detected, None if unsupported
         """
-        if self.youtube_client.is_youtube_url(url):
-            return AudioSourceType.YOUTUBE
-        elif self.catbox_client.is_catbox_url(url):
-            return AudioSourceType.CATBOX
-        else:
+        match = _URL_CLASSIFIER.match(url)
+        if match is None:
             return None
+        if match.lastgroup == 'yt':
+            return AudioSourceType.YOUTUBE if self.youtube_client.is_youtube_url(url) else None
+        return AudioSourceType.CATBOX if self.catbox_client.is_catbox_url(url) else None
 
     def is_supported_url(self, url: str) -> bool:
         """
@@ -132,27 +225,39 @@ class MusicPlayer:
             if not source_type:
                 return False, None, "Unsupported URL format. Please provide a YouTube or Catbox audio file URL."
 
-            # Extract audio info based on source type
-            unified_audio_info = None
+            # Check the metadata cache before hitting the network
+            cache_key = _canonical_url(url)
+            unified_audio_info = self._get_cached_info(cache_key)
 
-            if source_type == AudioSourceType.YOUTUBE:
-                self.logger.debug(f"Processing YouTube URL: {url}")
-                youtube_info = await self.youtube_client.extract_audio_info(url)
-                if youtube_info:
-                    unified_audio_info = UnifiedAudioInfo.from_youtube_info(youtube_info)
+            if unified_audio_info is None:
+                # Extract audio info based on source type
+                if source_type == AudioSourceType.YOUTUBE:
+                    self.logger.debug(f"Processing YouTube URL: {url}")
+                    youtube_info = await self.youtube_client.extract_audio_info(url)
+                    if youtube_info:
+                        unified_audio_info = UnifiedAudioInfo.from_youtube_info(youtube_info)
+
+                elif source_type == AudioSourceType.CATBOX:
+                    self.logger.debug(f"Processing Catbox URL: {url}")
+                    catbox_info = await self.catbox_client.extract_audio_info(url)
+                    if catbox_info:
+                        unified_audio_info = UnifiedAudioInfo.from_catbox_info(catbox_info)
+
+                if not unified_audio_info:
+                    return False, None, "Failed to extract audio information from URL"
 
-            elif source_type == AudioSourceType.CATBOX:
-                self.logger.debug(f"Processing Catbox URL: {url}")
-                catbox_info = await self.catbox_client.extract_audio_info(url)
-                if catbox_info:
-                    unified_audio_info = UnifiedAudioInfo.from_catbox_info(catbox_info)
+                self._cache_info(cache_key, unified_audio_info)
 
-            if not unified_audio_info:
-                return False, None, "Failed to extract audio information from URL"
+            # Bind the source-specific prepare step to the song now, so the
+            # playback loop never re-dispatches on source type
+            if source_type == AudioSourceType.YOUTUBE:
+                resolver = partial(self.youtube_client.download_audio, url)
+            else:
+                resolver = partial(self.catbox_client.validate_audio_file, url)
 
             # Add to queue
             queue_manager = self.get_queue_manager(guild_id)
-            position = await queue_manager.add_song(unified_audio_info, requester)
+            position = await queue_manager.add_song(unified_audio_info, requester, resolver)
 
             self.logger.info(f"Added {source_type.value} song to queue: {unified_audio_info.title} (position {position})")
 
@@ -167,9 +272,45 @@ class MusicPlayer:
 
         except Exception as e:
             error_msg = f"Error adding song to queue: {e}"
-            self.logger.error(error_msg, exc_info=True)
+            self.logger.error(error_msg, exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return False, None, error_msg
 
+    def _get_cached_info(self, cache_key: str) -> Optional[UnifiedAudioInfo]:
+        """
+        Look up cached audio metadata for a canonical URL.
+
+        Args:
+            cache_key: Canonical URL (see _canonical_url)
+
+        Returns:
+            Cached UnifiedAudioInfo, or None on miss/expiry
+        """
+        cached = self._info_cache.get(cache_key)
+        if not cached:
+            return None
+
+        timestamp, info = cached
+        if self._clock() - timestamp >= self._INFO_TTL:
+            del self._info_cache[cache_key]
+            return None
+
+        self._info_cache.move_to_end(cache_key)
+        self.logger.debug(f"Metadata cache hit for {cache_key}")
+        return info
+
+    def _cache_info(self, cache_key: str, info: UnifiedAudioInfo) -> None:
+        """
+        Store audio metadata in the cache with LRU eviction.
+
+        Args:
+            cache_key: Canonical URL (see _canonical_url)
+            info: Extracted audio metadata
+        """
+        self._info_cache[cache_key] = (self._clock(), info)
+        self._info_cache.move_to_end(cache_key)
+        while len(self._info_cache) > self._INFO_MAX:
+            self._info_cache.popitem(last=False)
+
     async def connect_to_user_channel(self, member: discord.Member) -> tuple[bool, Optional[str]]:
         """
         Connect to the voice channel the user is in.
@@ -225,7 +366,7 @@ class MusicPlayer:
 
         except Exception as e:
             error_msg = f"Error skipping song: {e}"
-            self.logger.error(error_msg, exc_info=True)
+            self.logger.error(error_msg, exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return False, None, error_msg
 
     async def stop_playback(self, guild_id: int) -> tuple[bool, Optional[str]]:
@@ -257,7 +398,7 @@ class MusicPlayer:
 
         except Exception as e:
             error_msg = f"Error stopping playback: {e}"
-            self.logger.error(error_msg, exc_info=True)
+            self.logger.error(error_msg, exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return False, error_msg
 
     async def jump_to_position(self, guild_id: int, position: int) -> tuple[bool, Optional[str], Optional[str]]:
@@ -280,6 +421,11 @@ class MusicPlayer:
             # Clean up current audio file
             await self._cleanup_current_audio(guild_id)
 
+            # The in-flight prefetch (if any) targeted the old next song;
+            # cancel it now rather than letting the download run to
+            # completion only to be discarded by the URL match later
+            self._discard_prefetch(self._get_state(guild_id))
+
             # Jump to position
             song = await queue_manager.jump_to_position(position)
             if not song:
@@ -290,7 +436,7 @@ class MusicPlayer:
 
         except Exception as e:
             error_msg = f"Error jumping to position {position}: {e}"
-            self.logger.error(error_msg, exc_info=True)
+            self.logger.error(error_msg, exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return False, None, error_msg
 
     async def get_queue_info(self, guild_id: int) -> Dict[str, Any]:
@@ -322,24 +468,19 @@ class MusicPlayer:
         Returns:
             Current position in seconds, or None if not playing
         """
-        if guild_id not in self._playback_start_times:
+        state = self._guilds.get(guild_id)
+        if state is None or state.start_time == 0.0:
             return None
 
-        start_time = self._playback_start_times[guild_id]
-        current_time = time.time()
-
-        # Calculate elapsed time
-        elapsed = current_time - start_time
-
-        # Subtract any paused duration
-        total_paused = self._total_paused_duration.get(guild_id, 0.0)
-
-        # If currently paused, add the current pause duration
-        if guild_id in self._playback_paused_times:
-            current_pause_duration = current_time - self._playback_paused_times[guild_id]
-            total_paused += current_pause_duration
-
-        return max(0.0, elapsed - total_paused)
+        # Branchless hot path: pause_start == 0.0 is the "not paused"
+        # sentinel, so the ongoing-pause term multiplies away to zero.
+        # Monotonic deltas can't go negative, so no max(0.0, ...) clamp.
+        now = self._clock()
+        return (
+            (now - state.start_time)
+            - state.paused_total
+            - (now - state.pause_start) * (state.pause_start != 0.0)
+        )
 
     def _start_playback_timing(self, guild_id: int) -> None:
         """
@@ -348,12 +489,10 @@ class MusicPlayer:
         Args:
             guild_id: Discord guild ID
         """
-        self._playback_start_times[guild_id] = time.time()
-        self._total_paused_duration[guild_id] = 0.0
-
-        # Clear any existing pause state
-        if guild_id in self._playback_paused_times:
-            del self._playback_paused_times[guild_id]
+        state = self._get_state(guild_id)
+        state.start_time = self._clock()
+        state.paused_total = 0.0
+        state.pause_start = 0.0
 
     def _pause_playback_timing(self, guild_id: int) -> None:
         """
@@ -362,8 +501,9 @@ class MusicPlayer:
         Args:
             guild_id: Discord guild ID
         """
-        if guild_id in self._playback_start_times and guild_id not in self._playback_paused_times:
-            self._playback_paused_times[guild_id] = time.time()
+        state = self._guilds.get(guild_id)
+        if state and state.start_time and not state.pause_start:
+            state.pause_start = self._clock()
 
     def _resume_playback_timing(self, guild_id: int) -> None:
         """
@@ -372,15 +512,10 @@ class MusicPlayer:
         Args:
             guild_id: Discord guild ID
         """
-        if guild_id in self._playback_paused_times:
-            pause_start = self._playback_paused_times[guild_id]
-            pause_duration = time.time() - pause_start
-
-            # Add to total paused duration
-            self._total_paused_duration[guild_id] = self._total_paused_duration.get(guild_id, 0.0) + pause_duration
-
-            # Remove from paused state
-            del self._playback_paused_times[guild_id]
+        state = self._guilds.get(guild_id)
+        if state and state.pause_start:
+            state.paused_total += self._clock() - state.pause_start
+            state.pause_start = 0.0
 
     def _stop_playback_timing(self, guild_id: int) -> None:
         """
@@ -389,13 +524,11 @@ class MusicPlayer:
         Args:
             guild_id: Discord guild ID
         """
-        # Clean up timing state
-        if guild_id in self._playback_start_times:
-            del self._playback_start_times[guild_id]
-        if guild_id in self._playback_paused_times:
-            del self._playback_paused_times[guild_id]
-        if guild_id in self._total_paused_duration:
-            del self._total_paused_duration[guild_id]
+        state = self._guilds.get(guild_id)
+        if state:
+            state.start_time = 0.0
+            state.pause_start = 0.0
+            state.paused_total = 0.0
 
     async def seek_to_position(self, guild_id: int, time_str: str) -> tuple[bool, Optional[str]]:
         """
@@ -413,28 +546,28 @@ class MusicPlayer:
             if not self.voice_manager.is_connected(guild_id):
                 return False, "No active music playback"
 
-            # Get current song
+            # Get current song and duration in one lock acquisition, so the
+            # pair can't be torn by the song changing between reads
             queue_manager = self.get_queue_manager(guild_id)
-            current_song = await queue_manager.get_current_song()
-            if not current_song:
+            snapshot = await queue_manager.snapshot_current()
+            if snapshot is None:
                 return False, "No song currently playing"
+            current_song, song_duration = snapshot
 
             # Parse seek time
             seek_result = self.seek_manager.parse_seek_time(time_str)
             if not seek_result.success or seek_result.target_position is None:
                 return False, seek_result.error_message or "Failed to parse seek time"
 
-            # Get current position and song duration
+            # Get current position
             current_position = self.get_current_playback_position(guild_id) or 0.0
-            song_duration = float(current_song.duration)
 
             # Validate seek position
-            is_relative = self.seek_manager.is_relative_seek(time_str)
             validation_result = self.seek_manager.validate_seek_position(
                 seek_result.target_position,
                 current_position,
                 song_duration,
-                is_relative
+                seek_result.is_relative
             )
 
             if not validation_result.success or validation_result.target_position is None:
@@ -452,7 +585,7 @@ class MusicPlayer:
 
         except Exception as e:
             error_msg = f"Error seeking to position: {e}"
-            self.logger.error(error_msg, exc_info=True)
+            self.logger.error(error_msg, exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return False, error_msg
 
     async def _perform_seek(self, guild_id: int, target_seconds: float, song: Song) -> bool:
@@ -469,35 +602,36 @@ class MusicPlayer:
         """
         try:
             # Get the audio file path
-            audio_file_path = self._current_audio_files.get(guild_id)
+            state = self._guilds.get(guild_id)
+            audio_file_path = state.audio_file if state else None
             if not audio_file_path:
                 self.logger.error(f"No audio file path available for seek in guild {guild_id}")
                 return False
 
-            # Stop current playback
-            self.voice_manager.stop_audio(guild_id)
+            # Stop the old playback in an executor while the replacement
+            # ffmpeg spawns; overlapping the two hides the process spawn
+            # time from the user-perceived seek latency
+            stop_task = asyncio.get_running_loop().run_in_executor(
+                None, self.voice_manager.stop_audio, guild_id
+            )
 
-            # Create new audio source with seek position
-            seek_options = f'-ss {target_seconds} -vn'
-            audio_source = discord.FFmpegPCMAudio(
+            # Create new audio source with seek position. Passing -ss as an
+            # input option (before -i) makes ffmpeg seek the container
+            # directly instead of decoding and discarding from frame 0.
+            audio_source = await self._create_audio_source(
+                guild_id,
                 audio_file_path,
-                options=seek_options
+                before_options=f'-ss {target_seconds}'
             )
 
+            # Old source must be fully stopped before starting the new one
+            await stop_task
+
             # Update timing tracking for the new position
             self._update_timing_after_seek(guild_id, target_seconds)
 
             # Start playback from new position
-            playback_finished = asyncio.Event()
-
-            def after_playback(error):
-                if error:
-                    self.logger.error(f"Playback error after seek: {error}")
-                playback_finished.set()
-
-            success = await self.voice_manager.play_audio(
-                guild_id, audio_source, after_playback
-            )
+            success, _finished = await self._start_audio(guild_id, audio_source)
 
             if success:
                 self.logger.debug(f"Seek successful: started playback from {target_seconds}s")
@@ -507,7 +641,8 @@ class MusicPlayer:
             return success
 
         except Exception as e:
-            self.logger.error(f"Error performing seek operation: {e}", exc_info=True)
+            self.logger.error("Error performing seek operation: %r", e,
+                              exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return False
 
     def _update_timing_after_seek(self, guild_id: int, target_seconds: float) -> None:
@@ -518,18 +653,15 @@ class MusicPlayer:
             guild_id: Discord guild ID
             target_seconds: Position that was seeked to
         """
-        current_time = time.time()
+        state = self._get_state(guild_id)
 
         # Adjust the start time to account for the seek position
         # New start time = current time - target position
-        self._playback_start_times[guild_id] = current_time - target_seconds
+        state.start_time = self._clock() - target_seconds
 
-        # Reset paused duration tracking
-        self._total_paused_duration[guild_id] = 0.0
-
-        # Clear any existing pause state
-        if guild_id in self._playback_paused_times:
-            del self._playback_paused_times[guild_id]
+        # Reset pause tracking
+        state.paused_total = 0.0
+        state.pause_start = 0.0
 
         self.logger.debug(f"Updated timing after seek: new start time accounts for {target_seconds}s offset")
 
@@ -551,13 +683,14 @@ class MusicPlayer:
         Args:
             guild_id: Discord guild ID
         """
-        # Cancel existing timer if any
-        if guild_id in self._inactivity_timers:
-            self._inactivity_timers[guild_id].cancel()
-            del self._inactivity_timers[guild_id]
+        state = self._get_state(guild_id)
+
+        # Disarm any pending deadline; its heap entry becomes stale and is
+        # skipped when the scheduler reaches it
+        state.expiry_deadline = 0.0
 
         # Update last activity time
-        self._last_activity_times[guild_id] = time.time()
+        state.last_activity = self._clock()
 
         self.logger.debug(f"Reset inactivity timer for guild {guild_id}")
 
@@ -565,40 +698,82 @@ class MusicPlayer:
         """
         Start the inactivity timer for a guild (no active playback).
 
+        All guilds share one expiry heap and a single TimerHandle armed for
+        the earliest deadline, rather than parking one sleeping task per
+        guild.
+
         Args:
             guild_id: Discord guild ID
         """
-        # Cancel existing timer if any
-        if guild_id in self._inactivity_timers:
-            self._inactivity_timers[guild_id].cancel()
+        state = self._get_state(guild_id)
 
         # Get timeout from config
         timeout_seconds = self._get_auto_disconnect_timeout()
 
-        # Create new inactivity timer task
-        timer_task = asyncio.create_task(
-            self._inactivity_timer_task(guild_id, timeout_seconds)
-        )
-        self._inactivity_timers[guild_id] = timer_task
+        # Arm the deadline; an older entry for this guild becomes stale
+        deadline = self._clock() + timeout_seconds
+        state.expiry_deadline = deadline
+        heapq.heappush(self._expiry_heap, (deadline, guild_id))
+        self._schedule_next_expiry()
 
         self.logger.debug(f"Started inactivity timer for guild {guild_id} ({timeout_seconds}s)")
 
-    async def _inactivity_timer_task(self, guild_id: int, timeout_seconds: int) -> None:
+    def _schedule_next_expiry(self) -> None:
+        """Arm the shared TimerHandle for the earliest live deadline."""
+        # Drop stale heap entries (deadline disarmed or superseded)
+        while self._expiry_heap:
+            deadline, guild_id = self._expiry_heap[0]
+            state = self._guilds.get(guild_id)
+            if state is not None and state.expiry_deadline == deadline:
+                break
+            heapq.heappop(self._expiry_heap)
+
+        if self._expiry_handle:
+            self._expiry_handle.cancel()
+            self._expiry_handle = None
+
+        if not self._expiry_heap:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No running loop (sync construction/tests); the handle is armed
+            # again on the next activity from within the loop
+            return
+
+        delay = max(0.0, self._expiry_heap[0][0] - self._clock())
+        self._expiry_handle = loop.call_later(delay, self._fire_expirations)
+
+    def _fire_expirations(self) -> None:
+        """TimerHandle callback: expire every guild whose deadline passed."""
+        self._expiry_handle = None
+        now = self._clock()
+
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            deadline, guild_id = heapq.heappop(self._expiry_heap)
+            state = self._guilds.get(guild_id)
+            if state is None or state.expiry_deadline != deadline:
+                continue  # stale entry
+            state.expiry_deadline = 0.0
+            # The state slot keeps the strong reference to the task
+            state.inactivity_timer = asyncio.create_task(self._expire_guild(guild_id))
+
+        self._schedule_next_expiry()
+
+    async def _expire_guild(self, guild_id: int) -> None:
         """
-        Inactivity timer task that disconnects after timeout.
+        Disconnect a guild whose inactivity deadline has passed.
 
         Args:
             guild_id: Discord guild ID
-            timeout_seconds: Timeout duration in seconds
         """
         try:
-            await asyncio.sleep(timeout_seconds)
-
             # Check if still connected and inactive
             if (self.voice_manager.is_connected(guild_id) and
                 not self.voice_manager.is_playing(guild_id)):
 
-                self.logger.info(f"Auto-disconnecting from guild {guild_id} after {timeout_seconds}s of inactivity")
+                self.logger.info(f"Auto-disconnecting from guild {guild_id} after inactivity timeout")
 
                 # Clean up any remaining state
                 await self._cleanup_guild_state(guild_id)
@@ -606,14 +781,34 @@ class MusicPlayer:
                 # Disconnect from voice channel
                 await self.voice_manager.disconnect_from_guild(guild_id)
 
+                # Release the state entry itself - the guild is fully idle
+                self._drop_state(guild_id)
+
         except asyncio.CancelledError:
-            self.logger.debug(f"Inactivity timer cancelled for guild {guild_id}")
+            self.logger.debug(f"Inactivity disconnect cancelled for guild {guild_id}")
         except Exception as e:
-            self.logger.error(f"Error in inactivity timer for guild {guild_id}: {e}", exc_info=True)
+            self.logger.error("Error in inactivity disconnect for guild %d: %r", guild_id, e,
+                              exc_info=self.logger.isEnabledFor(logging.DEBUG))
         finally:
-            # Clean up timer reference
-            if guild_id in self._inactivity_timers:
-                del self._inactivity_timers[guild_id]
+            # Clean up task reference
+            state = self._guilds.get(guild_id)
+            if state:
+                state.inactivity_timer = None
+
+    def _drop_state(self, guild_id: int) -> None:
+        """
+        Remove a guild's state entry once the guild is fully idle.
+
+        Without this, ``_guilds`` only ever grows: a bot that has touched
+        thousands of guilds would keep a GuildState (and its queue manager)
+        for each one forever. This is the single place entries are removed,
+        so there are no scattered check-then-delete cycles to desync.
+
+        Args:
+            guild_id: Discord guild ID
+        """
+        if self._guilds.pop(guild_id, None) is not None:
+            self.logger.debug(f"Dropped idle state for guild {guild_id}")
 
     def _stop_inactivity_timer(self, guild_id: int) -> None:
         """
@@ -622,9 +817,19 @@ class MusicPlayer:
         Args:
             guild_id: Discord guild ID
         """
-        if guild_id in self._inactivity_timers:
-            self._inactivity_timers[guild_id].cancel()
-            del self._inactivity_timers[guild_id]
+        state = self._guilds.get(guild_id)
+        if state is None:
+            return
+
+        stopped = state.expiry_deadline != 0.0
+        state.expiry_deadline = 0.0
+
+        if state.inactivity_timer:
+            state.inactivity_timer.cancel()
+            state.inactivity_timer = None
+            stopped = True
+
+        if stopped:
             self.logger.debug(f"Stopped inactivity timer for guild {guild_id}")
 
     async def _cleanup_guild_state(self, guild_id: int) -> None:
@@ -634,10 +839,18 @@ class MusicPlayer:
         Args:
             guild_id: Discord guild ID
         """
-        # Cancel playback task
-        if guild_id in self._playback_tasks:
-            self._playback_tasks[guild_id].cancel()
-            del self._playback_tasks[guild_id]
+        state = self._guilds.get(guild_id)
+        if state is None:
+            return
+
+        # Cancel all scheduled tasks (playback, prefetch, inactivity timer).
+        # Not awaited: this runs inside the inactivity timer task itself on
+        # the auto-disconnect path; _cancel_guild_tasks skips the current
+        # task so the expiry task never cancels itself mid-disconnect.
+        self._cancel_guild_tasks(state)
+
+        # Discard any prefetched audio file
+        self._discard_prefetch(state)
 
         # Clean up audio file
         await self._cleanup_current_audio(guild_id)
@@ -645,12 +858,11 @@ class MusicPlayer:
         # Stop timing tracking
         self._stop_playback_timing(guild_id)
 
-        # Stop inactivity timer
-        self._stop_inactivity_timer(guild_id)
+        # Disarm any pending inactivity deadline
+        state.expiry_deadline = 0.0
 
         # Clear last activity time
-        if guild_id in self._last_activity_times:
-            del self._last_activity_times[guild_id]
+        state.last_activity = 0.0
 
         self.logger.debug(f"Cleaned up all state for guild {guild_id}")
 
@@ -666,15 +878,17 @@ class MusicPlayer:
             guild_id: Discord guild ID
             progress_callback: Optional progress callback
         """
-        if guild_id in self._playback_tasks:
+        state = self._get_state(guild_id)
+        if state.playback_task and not state.playback_task.done():
             return  # Already playing
 
         # Reset inactivity timer (activity detected)
         self._reset_inactivity_timer(guild_id)
 
         # Create playback task
-        task = asyncio.create_task(self._playback_loop(guild_id, progress_callback))
-        self._playback_tasks[guild_id] = task
+        state.playback_task = asyncio.create_task(
+            self._playback_loop(guild_id, progress_callback)
+        )
 
     async def _playback_loop(
         self,
@@ -700,65 +914,27 @@ class MusicPlayer:
                     self._start_inactivity_timer(guild_id)
                     break
 
-                # Handle audio based on source type
-                audio_file_path = None
-
-                if hasattr(song.audio_info, 'source_type'):
-                    # New UnifiedAudioInfo format
-                    if song.audio_info.is_youtube():
-                        # Download YouTube audio
-                        success, youtube_audio_info, error = await self.youtube_client.download_audio(
-                            song.url, progress_callback
-                        )
-                        if not success or not youtube_audio_info:
-                            self.logger.error(f"Failed to download YouTube audio for {song.title}: {error}")
-                            continue
-                        audio_file_path = youtube_audio_info.file_path
-
-                    elif song.audio_info.is_catbox():
-                        # Validate Catbox audio file
-                        success, catbox_audio_info, error = await self.catbox_client.validate_audio_file(
-                            song.url, progress_callback
-                        )
-                        if not success or not catbox_audio_info:
-                            self.logger.error(f"Failed to validate Catbox audio for {song.title}: {error}")
-                            continue
-                        audio_file_path = catbox_audio_info.file_path  # This is the URL for streaming
-
-                else:
-                    # Legacy AudioInfo format (YouTube only)
-                    success, youtube_audio_info, error = await self.youtube_client.download_audio(
-                        song.url, progress_callback
-                    )
-                    if not success or not youtube_audio_info:
-                        self.logger.error(f"Failed to download audio for {song.title}: {error}")
-                        continue
-                    audio_file_path = youtube_audio_info.file_path
+                # Reuse prefetched audio when it matches the popped song,
+                # otherwise download/validate it now
+                audio_file_path = await self._take_prefetched(guild_id, song)
+                if audio_file_path is None:
+                    audio_file_path = await self._resolve_audio_file(song, progress_callback)
 
                 if not audio_file_path:
                     self.logger.error(f"No audio file path available for {song.title}")
                     continue
 
-                # Store current audio file path (for cleanup)
-                self._current_audio_files[guild_id] = audio_file_path
+                # Store current audio file path (for cleanup), classifying
+                # it once so cleanup never re-inspects the string
+                state = self._get_state(guild_id)
+                state.audio_file = audio_file_path
+                state.is_local_file = not audio_file_path.startswith('http')
 
                 # Create audio source (works for both local files and URLs)
-                audio_source = discord.FFmpegPCMAudio(
-                    audio_file_path,
-                    options='-vn'  # No video
-                )
+                audio_source = await self._create_audio_source(guild_id, audio_file_path)
 
                 # Play audio
-                playback_finished = asyncio.Event()
-
-                def after_playback(error):
-                    if error:
-                        self.logger.error(f"Playback error: {error}")
-                    playback_finished.set()
-
-                success = await self.voice_manager.play_audio(
-                    guild_id, audio_source, after_playback
-                )
+                success, playback_finished = await self._start_audio(guild_id, audio_source)
 
                 if not success:
                     self.logger.error(f"Failed to start playback for {song.title}")
@@ -770,8 +946,12 @@ class MusicPlayer:
 
                 self.logger.info(f"Now playing: {song.title}")
 
+                # Overlap the next song's download/validation with current
+                # playback so there's no silent gap between tracks
+                state.prefetch_task = asyncio.create_task(self._prefetch_next(guild_id))
+
                 # Wait for playback to finish
-                await playback_finished.wait()
+                await playback_finished
 
                 # Stop timing tracking
                 self._stop_playback_timing(guild_id)
@@ -782,13 +962,413 @@ class MusicPlayer:
         except asyncio.CancelledError:
             self.logger.debug(f"Playback loop cancelled for guild {guild_id}")
         except Exception as e:
-            self.logger.error(f"Error in playback loop for guild {guild_id}: {e}", exc_info=True)
+            self.logger.error("Error in playback loop for guild %d: %r", guild_id, e,
+                              exc_info=self.logger.isEnabledFor(logging.DEBUG))
         finally:
             # Clean up
-            if guild_id in self._playback_tasks:
-                del self._playback_tasks[guild_id]
+            state = self._guilds.get(guild_id)
+            if state:
+                state.playback_task = None
             await self._cleanup_current_audio(guild_id)
 
+    async def _resolve_audio_file(
+        self,
+        song: Song,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Optional[str]:
+        """
+        Download or validate a song's audio and return a playable path.
+
+        Args:
+            song: Song to resolve
+            progress_callback: Optional progress callback
+
+        Returns:
+            Local file path (YouTube) or streaming URL (Catbox), or None
+            if resolution failed
+        """
+        if song.resolver is not None:
+            # Dispatch was bound at queue-add time
+            success, info, error = await song.resolver(progress_callback)
+            if not success or not info:
+                self.logger.error(f"Failed to prepare audio for {song.title}: {error}")
+                return None
+            return info.file_path
+
+        # Fallback for songs queued without a bound resolver
+        if hasattr(song.audio_info, 'source_type'):
+            # New UnifiedAudioInfo format
+            if song.audio_info.is_youtube():
+                # Download YouTube audio
+                success, youtube_audio_info, error = await self.youtube_client.download_audio(
+                    song.url, progress_callback
+                )
+                if not success or not youtube_audio_info:
+                    self.logger.error(f"Failed to download YouTube audio for {song.title}: {error}")
+                    return None
+                return youtube_audio_info.file_path
+
+            if song.audio_info.is_catbox():
+                # Validate Catbox audio file
+                success, catbox_audio_info, error = await self.catbox_client.validate_audio_file(
+                    song.url, progress_callback
+                )
+                if not success or not catbox_audio_info:
+                    self.logger.error(f"Failed to validate Catbox audio for {song.title}: {error}")
+                    return None
+                return catbox_audio_info.file_path  # This is the URL for streaming
+
+            return None
+
+        # Legacy AudioInfo format (YouTube only)
+        success, youtube_audio_info, error = await self.youtube_client.download_audio(
+            song.url, progress_callback
+        )
+        if not success or not youtube_audio_info:
+            self.logger.error(f"Failed to download audio for {song.title}: {error}")
+            return None
+        return youtube_audio_info.file_path
+
+    async def _prefetch_next(self, guild_id: int) -> None:
+        """
+        Resolve the next queued song's audio while the current one plays.
+
+        Stores the result on the guild state; the playback loop reuses it
+        via :meth:`_take_prefetched` when the song is actually popped.
+
+        Args:
+            guild_id: Discord guild ID
+        """
+        song = await self.get_queue_manager(guild_id).peek_next()
+        if not song:
+            return
+
+        try:
+            audio_file_path = await self._resolve_audio_file(song)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.warning(f"Prefetch failed for {song.title}: {e}")
+            return
+
+        if audio_file_path:
+            self._get_state(guild_id).prefetched = (song.url, audio_file_path)
+            self.logger.debug(f"Prefetched audio for {song.title}")
+
+    async def _take_prefetched(self, guild_id: int, song: Song) -> Optional[str]:
+        """
+        Claim the prefetched audio for a song, if it matches.
+
+        Waits for an in-flight prefetch to finish rather than cancelling it
+        (it is almost always resolving the song we just popped). A stale
+        result for a different song - the queue was reordered - is discarded
+        and its local file cleaned up.
+
+        Args:
+            guild_id: Discord guild ID
+            song: Song that was just popped from the queue
+
+        Returns:
+            Prefetched audio path/URL, or None if nothing usable was cached
+        """
+        state = self._get_state(guild_id)
+
+        if state.prefetch_task:
+            if not state.prefetch_task.done():
+                try:
+                    # shield keeps a cancel aimed at the playback loop from
+                    # being delivered as the prefetch task's cancellation
+                    await asyncio.shield(state.prefetch_task)
+                except asyncio.CancelledError:
+                    # Swallow only the prefetch's own cancellation; an outer
+                    # cancel (stop/cleanup) must keep propagating or the
+                    # playback loop would survive it and play on
+                    if not state.prefetch_task.cancelled():
+                        raise
+                except Exception:
+                    pass
+            state.prefetch_task = None
+
+        entry, state.prefetched = state.prefetched, None
+        if entry is None:
+            return None
+
+        url, audio_file_path = entry
+        if url == song.url:
+            return audio_file_path
+
+        # Stale prefetch; only clean up local files, not streaming URLs
+        if not audio_file_path.startswith('http'):
+            self._schedule_file_deletion(audio_file_path)
+        return None
+
+    def _schedule_file_deletion(self, file_path: str) -> None:
+        """
+        Queue a temp audio file for background deletion.
+
+        unlink is synchronous and can be slow (NFS, antivirus scans), so the
+        playback loop hands paths to a janitor task that batches deletions
+        in the default executor instead of blocking the event loop between
+        songs. Falls back to inline deletion when no loop is running.
+
+        Args:
+            file_path: Path of the file to delete
+        """
+        if self._deletion_queue is None:
+            self._deletion_queue = asyncio.Queue()
+
+        if self._janitor_task is None or self._janitor_task.done():
+            try:
+                self._janitor_task = asyncio.create_task(self._janitor())
+            except RuntimeError:
+                # No running event loop (sync cleanup path) - delete inline
+                self._janitor_task = None
+                self.youtube_client.cleanup_file(file_path)
+                return
+
+        self._deletion_queue.put_nowait(file_path)
+
+    async def _janitor(self) -> None:
+        """Delete queued temp files in batches, off the event loop."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            paths = [await self._deletion_queue.get()]
+            while not self._deletion_queue.empty() and len(paths) < 64:
+                paths.append(self._deletion_queue.get_nowait())
+            await loop.run_in_executor(None, self._unlink_many, paths)
+
+    def _unlink_many(self, paths: List[str]) -> None:
+        """
+        Delete a batch of temp files (runs in an executor thread).
+
+        Args:
+            paths: File paths to delete
+        """
+        for path in paths:
+            self.youtube_client.cleanup_file(path)
+
+    def _cancel_guild_tasks(self, state: GuildState) -> List[asyncio.Task]:
+        """
+        Cancel all of a guild's scheduled tasks and return them.
+
+        Snapshots the task references before clearing them, so callers that
+        want to await completion (e.g. :meth:`cleanup_all`) gather over a
+        stable list instead of state that other coroutines may mutate. The
+        GuildState slots hold the only strong references to these tasks;
+        clearing them here is the single place tasks are released.
+
+        Args:
+            state: Guild state whose tasks should be cancelled
+
+        Returns:
+            List of the cancelled tasks (may be empty)
+        """
+        tasks = []
+
+        # Never cancel the task this is running inside: on the auto-
+        # disconnect path the expiry task itself calls here (via
+        # _cleanup_guild_state), and a self-cancel would fire at its next
+        # await and abort the disconnect. The owner clears its own slot.
+        try:
+            current = asyncio.current_task()
+        except RuntimeError:
+            current = None
+
+        if state.playback_task and state.playback_task is not current:
+            state.playback_task.cancel()
+            tasks.append(state.playback_task)
+            state.playback_task = None
+
+        if state.prefetch_task and state.prefetch_task is not current:
+            state.prefetch_task.cancel()
+            tasks.append(state.prefetch_task)
+            state.prefetch_task = None
+
+        if state.stream_task and state.stream_task is not current:
+            state.stream_task.cancel()
+            tasks.append(state.stream_task)
+            state.stream_task = None
+
+        if state.inactivity_timer and state.inactivity_timer is not current:
+            state.inactivity_timer.cancel()
+            tasks.append(state.inactivity_timer)
+            state.inactivity_timer = None
+
+        return tasks
+
+    def _discard_prefetch(self, state: GuildState) -> None:
+        """
+        Cancel an in-flight prefetch and drop any cached result.
+
+        Args:
+            state: Guild state holding the prefetch
+        """
+        if state.prefetch_task:
+            state.prefetch_task.cancel()
+            state.prefetch_task = None
+
+        entry, state.prefetched = state.prefetched, None
+        if entry is not None and not entry[1].startswith('http'):
+            self._schedule_file_deletion(entry[1])
+
+    async def _start_audio(
+        self,
+        guild_id: int,
+        audio_source: discord.AudioSource
+    ) -> Tuple[bool, "asyncio.Future"]:
+        """
+        Start playing an audio source and return a completion future.
+
+        discord.py invokes the after-playback callback from its audio thread,
+        so the callback hops back onto the event loop with
+        call_soon_threadsafe and resolves a future instead of setting a
+        threading-style event. Callers that need to block until the song ends
+        await the returned future; callers that only need playback started
+        (e.g. seeking) ignore it.
+
+        Args:
+            guild_id: Discord guild ID
+            audio_source: Audio source to play
+
+        Returns:
+            Tuple of (playback started successfully, future resolved when
+            playback finishes)
+        """
+        loop = asyncio.get_running_loop()
+        finished: asyncio.Future = loop.create_future()
+
+        def resolve(error: Optional[Exception]) -> None:
+            if error:
+                self.logger.error(f"Playback error: {error}")
+            if not finished.done():
+                finished.set_result(error)
+
+        def after_playback(error: Optional[Exception]) -> None:
+            loop.call_soon_threadsafe(resolve, error)
+
+        success = await self.voice_manager.play_audio(
+            guild_id, audio_source, after_playback
+        )
+        return success, finished
+
+    async def _open_http_stream(self, guild_id: int, url: str):
+        """
+        Stream a URL into an OS pipe through the shared aiohttp session.
+
+        ffmpeg's built-in HTTP client opens a cold TCP+TLS connection per
+        song and can't pool anything; routing the bytes through the shared
+        ClientSession reuses keep-alive connections when users queue several
+        Catbox files back-to-back. A background pump task copies response
+        chunks into the pipe's write end, doing the blocking writes in the
+        default executor so the event loop never stalls on a full pipe.
+
+        Args:
+            guild_id: Discord guild ID (the pump task is tracked per guild)
+            url: Audio URL to stream
+
+        Returns:
+            Readable file object for FFmpegOpusAudio(..., pipe=True)
+        """
+        session = await get_shared_session()
+        read_fd, write_fd = os.pipe()
+        writer = os.fdopen(write_fd, 'wb', buffering=0)
+
+        async def pump() -> None:
+            loop = asyncio.get_running_loop()
+            try:
+                # Session default timeout (total=30) would cut the stream
+                # mid-song; cap per-read stalls instead of total duration
+                async with session.get(url, timeout=STREAMING_TIMEOUT) as response:
+                    response.raise_for_status()
+                    async for chunk in response.content.iter_chunked(65536):
+                        await loop.run_in_executor(None, writer.write, chunk)
+            except (BrokenPipeError, OSError, ValueError):
+                # ffmpeg closed its end first (stop/skip) - expected
+                pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.warning(f"HTTP audio stream ended early for {url}: {e}")
+            finally:
+                try:
+                    writer.close()
+                except OSError:
+                    pass
+
+        state = self._get_state(guild_id)
+        if state.stream_task and not state.stream_task.done():
+            state.stream_task.cancel()
+        state.stream_task = asyncio.create_task(pump())
+
+        return os.fdopen(read_fd, 'rb')
+
+    async def _create_audio_source(
+        self,
+        guild_id: int,
+        audio_file_path: str,
+        before_options: Optional[str] = None
+    ) -> discord.AudioSource:
+        """
+        Create an Opus audio source for a local file or streaming URL.
+
+        Uses FFmpegOpusAudio so ffmpeg emits Opus frames directly and
+        discord.py passes them through unchanged, instead of decoding to PCM
+        and re-encoding to Opus in Python every 20 ms frame.
+
+        Args:
+            guild_id: Discord guild ID
+            audio_file_path: Local file path or streaming URL
+            before_options: Optional ffmpeg input options (e.g. fast seek)
+
+        Returns:
+            discord.AudioSource ready for playback
+        """
+        # The FFmpegOpusAudio constructor fork+execs ffmpeg synchronously;
+        # spawn it in the default executor so the event loop (and the
+        # Discord heartbeat) never blocks on process creation
+        loop = asyncio.get_running_loop()
+
+        if audio_file_path.startswith('http'):
+            if before_options is None:
+                # Normal playback: pipe the bytes in via the shared pooled
+                # HTTP session (see _open_http_stream)
+                stream = await self._open_http_stream(guild_id, audio_file_path)
+                return await loop.run_in_executor(None, partial(
+                    discord.FFmpegOpusAudio,
+                    stream,
+                    pipe=True,
+                    options='-vn'  # No video
+                ))
+
+            # Seeking: hand the URL to ffmpeg directly so it can byte-seek
+            # with HTTP range requests instead of reading through a pipe,
+            # with reconnects on dropped connections
+            stream_options = f'-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5 {before_options}'
+            return await loop.run_in_executor(None, partial(
+                discord.FFmpegOpusAudio,
+                audio_file_path,
+                before_options=stream_options,
+                options='-vn'  # No video
+            ))
+
+        # Local file: probe codec/bitrate so ffmpeg encodes matching Opus.
+        # from_probe would spawn ffmpeg on the loop after probing, so probe
+        # here and construct the source in the executor like the branches
+        # above
+        codec, bitrate = await discord.FFmpegOpusAudio.probe(
+            audio_file_path,
+            method='fallback'
+        )
+        return await loop.run_in_executor(None, partial(
+            discord.FFmpegOpusAudio,
+            audio_file_path,
+            codec=codec,
+            bitrate=bitrate,
+            before_options=before_options,
+            options='-vn'  # No video
+        ))
+
     async def _cleanup_current_audio(self, guild_id: int) -> None:
         """
         Clean up the current audio file for a guild.
@@ -796,35 +1376,64 @@ class MusicPlayer:
         Args:
             guild_id: Discord guild ID
         """
-        if guild_id in self._current_audio_files:
-            file_path = self._current_audio_files[guild_id]
+        state = self._guilds.get(guild_id)
+        if state is None:
+            return
 
-            # Only clean up local files, not URLs
-            if file_path and not file_path.startswith('http'):
-                self.youtube_client.cleanup_file(file_path)
+        # Stop any HTTP stream pump left over from the finished song
+        if state.stream_task:
+            state.stream_task.cancel()
+            state.stream_task = None
+
+        if state.audio_file:
+            # Only clean up local files, not streaming URLs
+            if state.is_local_file:
+                self._schedule_file_deletion(state.audio_file)
 
-            del self._current_audio_files[guild_id]
+            state.audio_file = None
+            state.is_local_file = False
 
     async def cleanup_all(self) -> None:
         """Clean up all resources."""
         self.logger.info("Cleaning up music player resources")
 
-        # Cancel all playback tasks
-        for task in self._playback_tasks.values():
-            task.cancel()
+        # Cancel all playback tasks, prefetches and inactivity timers,
+        # snapshotting them first so the gather below is immune to tasks
+        # finishing (and clearing their slots) mid-iteration
+        all_tasks = []
+        for state in self._guilds.values():
+            all_tasks.extend(self._cancel_guild_tasks(state))
+            self._discard_prefetch(state)
 
-        # Cancel all inactivity timers
-        for timer_task in self._inactivity_timers.values():
-            timer_task.cancel()
+        # Disarm the shared inactivity scheduler
+        if self._expiry_handle:
+            self._expiry_handle.cancel()
+            self._expiry_handle = None
+        self._expiry_heap.clear()
 
         # Wait for tasks to complete
-        all_tasks = list(self._playback_tasks.values()) + list(self._inactivity_timers.values())
         if all_tasks:
             await asyncio.gather(*all_tasks, return_exceptions=True)
 
-        # Clean up audio files
-        for guild_id in list(self._current_audio_files.keys()):
-            await self._cleanup_current_audio(guild_id)
+        # Clean up audio files concurrently; each is just a queue put plus
+        # task bookkeeping, so N guilds shut down in O(1) awaits
+        if self._guilds:
+            await asyncio.gather(
+                *(self._cleanup_current_audio(gid) for gid in list(self._guilds)),
+                return_exceptions=True
+            )
+
+        # Stop the janitor and flush any deletions it hasn't processed yet
+        if self._janitor_task:
+            self._janitor_task.cancel()
+            self._janitor_task = None
+        if self._deletion_queue is not None and not self._deletion_queue.empty():
+            leftovers = []
+            while not self._deletion_queue.empty():
+                leftovers.append(self._deletion_queue.get_nowait())
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._unlink_many, leftovers
+            )
 
         # Clean up voice connections
         await self.voice_manager.cleanup_all_connections()
@@ -832,16 +1441,5 @@ class MusicPlayer:
         # Clean up HTTP sessions
         await self.catbox_client.cleanup()
 
-        # Clear state
-        self._playback_tasks.clear()
-        self._current_audio_files.clear()
-        self._queue_managers.clear()
-
-        # Clear timing state
-        self._playback_start_times.clear()
-        self._playback_paused_times.clear()
-        self._total_paused_duration.clear()
-
-        # Clear inactivity tracking state
-        self._inactivity_timers.clear()
-        self._last_activity_times.clear()
+        # Drop all per-guild state
+        self._guilds.clear()
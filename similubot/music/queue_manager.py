@@ -2,7 +2,7 @@
 
 import logging
 import asyncio
-from typing import List, Optional, Dict, Any
+from typing import Awaitable, Callable, List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import discord
@@ -17,6 +17,9 @@ class Song:
     audio_info: Union[AudioInfo, UnifiedAudioInfo]
     requester: discord.Member
     added_at: datetime = field(default_factory=datetime.now)
+    # Source-specific prepare callable (download/validate), bound once at
+    # queue-add time so playback needs no per-song type dispatch
+    resolver: Optional[Callable[..., Awaitable[Any]]] = field(default=None, compare=False)
 
     @property
     def title(self) -> str:
@@ -62,19 +65,25 @@ class QueueManager:
         
         self.logger.debug(f"Queue manager initialized for guild {guild_id}")
 
-    async def add_song(self, audio_info: Union[AudioInfo, UnifiedAudioInfo], requester: discord.Member) -> int:
+    async def add_song(
+        self,
+        audio_info: Union[AudioInfo, UnifiedAudioInfo],
+        requester: discord.Member,
+        resolver: Optional[Callable[..., Awaitable[Any]]] = None
+    ) -> int:
         """
         Add a song to the queue.
-        
+
         Args:
             audio_info: Audio information
             requester: User who requested the song
-            
+            resolver: Optional prepare callable bound to the song's source
+
         Returns:
             Position in queue (1-indexed)
         """
         async with self._lock:
-            song = Song(audio_info=audio_info, requester=requester)
+            song = Song(audio_info=audio_info, requester=requester, resolver=resolver)
             self._queue.append(song)
             position = len(self._queue)
             
@@ -98,6 +107,16 @@ class QueueManager:
             self.logger.info(f"Retrieved next song: {song.title}")
             return song
 
+    async def peek_next(self) -> Optional[Song]:
+        """
+        Look at the next song without removing it from the queue.
+
+        Returns:
+            Next song or None if queue is empty
+        """
+        async with self._lock:
+            return self._queue[0] if self._queue else None
+
     async def skip_current_song(self) -> Optional[Song]:
         """
         Skip the current song and get the next one.
@@ -185,6 +204,21 @@ class QueueManager:
         async with self._lock:
             return self._current_song
 
+    async def snapshot_current(self) -> Optional[Tuple[Song, float]]:
+        """
+        Get the current song and its duration under one lock acquisition.
+
+        Callers that need both would otherwise await the lock twice, leaving
+        a window in which the song can change between the reads.
+
+        Returns:
+            (song, duration in seconds) or None if nothing is playing
+        """
+        async with self._lock:
+            if self._current_song is None:
+                return None
+            return self._current_song, float(self._current_song.duration)
+
     async def remove_song_at_position(self, position: int) -> Optional[Song]:
         """
         Remove a song at a specific position.
@@ -1,10 +1,30 @@
 """Seek functionality manager for music playback."""
 
 import logging
-import re
-from typing import Optional, Tuple, Union
+from functools import lru_cache
+from typing import Optional
 from dataclasses import dataclass
 
+# Resolved once at import - getLogger takes the module lock, so per-instance
+# lookups in __init__ are wasted work
+_logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=4096)
+def _format_time_int(seconds: int) -> str:
+    """
+    Format a non-negative whole number of seconds as [HH:]MM:SS.
+
+    Cached: progress displays re-format the same integer second for up to
+    a full second of ticks, so repeats become a dict hit.
+    """
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+
+    if hours > 0:
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
+
 
 @dataclass
 class SeekResult:
@@ -12,6 +32,8 @@ class SeekResult:
     success: bool
     target_position: Optional[float] = None
     error_message: Optional[str] = None
+    # Set by parse_seek_time so callers need not re-inspect the input
+    is_relative: bool = False
 
 
 class SeekManager:
@@ -22,14 +44,9 @@ class SeekManager:
     and provides utilities for time-based navigation in audio tracks.
     """
 
-    # Regex patterns for different time formats
-    TIME_ABSOLUTE_PATTERN = re.compile(r'^(?:(\d{1,2}):)?(\d{1,2}):(\d{2})$')  # [hh:]mm:ss
-    TIME_RELATIVE_PATTERN = re.compile(r'^([+-])(?:(\d{1,2}):)?(\d{1,2}):(\d{2})$')  # +/-[hh:]mm:ss
-    TIME_SECONDS_ONLY_PATTERN = re.compile(r'^([+-])?(\d+)$')  # [+/-]seconds
-
     def __init__(self):
         """Initialize the seek manager."""
-        self.logger = logging.getLogger("similubot.music.seek_manager")
+        self.logger = _logger
 
     def parse_seek_time(self, time_str: str) -> SeekResult:
         """
@@ -50,91 +67,65 @@ class SeekManager:
             SeekResult with parsed time in seconds or error message
         """
         time_str = time_str.strip()
-        
+
         if not time_str:
             return SeekResult(False, error_message="Empty time string")
 
-        self.logger.debug(f"Parsing seek time: '{time_str}'")
-
-        # Try relative time with full format (+/-[hh:]mm:ss)
-        match = self.TIME_RELATIVE_PATTERN.match(time_str)
-        if match:
-            sign, hours, minutes, seconds = match.groups()
-            return self._parse_time_components(sign, hours, minutes, seconds, is_relative=True)
-
-        # Try absolute time format ([hh:]mm:ss)
-        match = self.TIME_ABSOLUTE_PATTERN.match(time_str)
-        if match:
-            hours, minutes, seconds = match.groups()
-            return self._parse_time_components(None, hours, minutes, seconds, is_relative=False)
-
-        # Try seconds only format ([+/-]seconds)
-        match = self.TIME_SECONDS_ONLY_PATTERN.match(time_str)
-        if match:
-            sign, seconds_str = match.groups()
-            try:
-                seconds = int(seconds_str)
-                if sign == '-':
-                    seconds = -seconds
-                elif sign == '+':
-                    pass  # Keep positive
-                # If no sign, treat as absolute
-                is_relative = sign is not None
-                
-                self.logger.debug(f"Parsed seconds only: {seconds} (relative: {is_relative})")
-                return SeekResult(True, target_position=float(seconds))
-            except ValueError:
-                return SeekResult(False, error_message=f"Invalid seconds value: {seconds_str}")
-
-        return SeekResult(False, error_message=f"Invalid time format: {time_str}")
-
-    def _parse_time_components(
-        self, 
-        sign: Optional[str], 
-        hours: Optional[str], 
-        minutes: str, 
-        seconds: str,
-        is_relative: bool
-    ) -> SeekResult:
-        """
-        Parse time components into total seconds.
-
-        Args:
-            sign: '+' or '-' for relative seeks, None for absolute
-            hours: Hours component (optional)
-            minutes: Minutes component
-            seconds: Seconds component
-            is_relative: Whether this is a relative seek
+        # %-style args so the string is only built when debug is enabled
+        self.logger.debug("Parsing seek time: %r", time_str)
+
+        # Single-pass parse instead of trying three regexes in sequence:
+        # optional sign, then 1-3 colon-separated digit runs. Field widths
+        # mirror the accepted shapes - hours and minutes are 1-2 digits,
+        # the trailing seconds field of a colon form is exactly 2.
+        sign: Optional[str] = None
+        body = time_str
+        if body[0] in '+-':
+            sign = body[0]
+            body = body[1:]
+
+        fields = body.split(':')
+        if not body or len(fields) > 3 or not all(f.isdigit() for f in fields):
+            return SeekResult(False, error_message=f"Invalid time format: {time_str}")
+
+        if len(fields) == 1:
+            # [+/-]seconds (no sign means absolute)
+            seconds = int(fields[0])
+            if sign == '-':
+                seconds = -seconds
+
+            self.logger.debug("Parsed seconds only: %d (relative: %s)", seconds, sign is not None)
+            return SeekResult(True, target_position=float(seconds), is_relative=sign is not None)
+
+        # [hh:]mm:ss
+        if len(fields) == 2:
+            h, m_str, s_str = 0, fields[0], fields[1]
+        else:
+            h_str, m_str, s_str = fields
+            if len(h_str) > 2:
+                return SeekResult(False, error_message=f"Invalid time format: {time_str}")
+            h = int(h_str)
 
-        Returns:
-            SeekResult with parsed time in seconds
-        """
-        try:
-            # Parse components
-            h = int(hours) if hours else 0
-            m = int(minutes)
-            s = int(seconds)
+        if len(m_str) > 2 or len(s_str) != 2:
+            return SeekResult(False, error_message=f"Invalid time format: {time_str}")
 
-            # Validate ranges
-            if m >= 60:
-                return SeekResult(False, error_message=f"Minutes must be less than 60: {m}")
-            if s >= 60:
-                return SeekResult(False, error_message=f"Seconds must be less than 60: {s}")
-            if h < 0 or m < 0 or s < 0:
-                return SeekResult(False, error_message="Time components cannot be negative")
+        m = int(m_str)
+        s = int(s_str)
 
-            # Calculate total seconds
-            total_seconds = h * 3600 + m * 60 + s
+        # Validate ranges
+        if m >= 60:
+            return SeekResult(False, error_message=f"Minutes must be less than 60: {m}")
+        if s >= 60:
+            return SeekResult(False, error_message=f"Seconds must be less than 60: {s}")
 
-            # Apply sign for relative seeks
-            if is_relative and sign == '-':
-                total_seconds = -total_seconds
+        total_seconds = h * 3600 + m * 60 + s
 
-            self.logger.debug(f"Parsed time components: {h}h {m}m {s}s = {total_seconds}s (relative: {is_relative})")
-            return SeekResult(True, target_position=float(total_seconds))
+        # Apply sign for relative seeks
+        if sign == '-':
+            total_seconds = -total_seconds
 
-        except ValueError as e:
-            return SeekResult(False, error_message=f"Invalid time components: {e}")
+        self.logger.debug("Parsed time components: %dh %dm %ds = %ds (relative: %s)", h, m, s, total_seconds, sign is not None)
+        return SeekResult(True, target_position=float(total_seconds), is_relative=sign is not None)
 
     def validate_seek_position(
         self, 
@@ -174,7 +165,7 @@ class SeekManager:
                 error_message=f"Cannot seek beyond song duration: {self.format_time(absolute_position)} > {self.format_time(song_duration)}"
             )
 
-        self.logger.debug(f"Validated seek position: {absolute_position}s (duration: {song_duration}s)")
+        self.logger.debug("Validated seek position: %ss (duration: %ss)", absolute_position, song_duration)
         return SeekResult(True, target_position=absolute_position)
 
     def is_relative_seek(self, time_str: str) -> bool:
@@ -187,12 +178,10 @@ class SeekManager:
         Returns:
             True if the time string is a relative seek (+/- prefix)
         """
-        time_str = time_str.strip()
-        return (
-            self.TIME_RELATIVE_PATTERN.match(time_str) is not None or
-            (self.TIME_SECONDS_ONLY_PATTERN.match(time_str) is not None and 
-             time_str.startswith(('+', '-')))
-        )
+        # Only the relative forms carry a sign prefix, so no pattern
+        # matching is needed; callers pair this with parse_seek_time,
+        # which rejects malformed input
+        return time_str.strip().startswith(('+', '-'))
 
     @staticmethod
     def format_time(seconds: float) -> str:
@@ -206,16 +195,8 @@ class SeekManager:
             Formatted time string
         """
         if seconds < 0:
-            return f"-{SeekManager.format_time(-seconds)}"
-
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-
-        if hours > 0:
-            return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-        else:
-            return f"{minutes:02d}:{secs:02d}"
+            return f"-{_format_time_int(int(-seconds))}"
+        return _format_time_int(int(seconds))
 
     def get_seek_examples(self) -> list[str]:
         """
@@ -5,6 +5,8 @@ import os
 import re
 import asyncio
 import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Optional, Tuple, Callable, Dict, Any
 from dataclasses import dataclass
 from pytubefix import YouTube
@@ -13,6 +15,11 @@ from pytubefix.exceptions import PytubeFixError
 from similubot.progress.base import ProgressTracker, ProgressInfo, ProgressStatus, ProgressCallback
 from similubot.utils.config_manager import ConfigManager
 
+# Module-level loggers: getLogger acquires the logging module lock, so
+# resolve each name once at import instead of per constructed object
+_progress_logger = logging.getLogger("similubot.progress.youtube")
+_logger = logging.getLogger(__name__)
+
 
 class YouTubeProgressTracker(ProgressTracker):
     """
@@ -25,9 +32,14 @@ class YouTubeProgressTracker(ProgressTracker):
     def __init__(self):
         """Initialize the YouTube progress tracker."""
         super().__init__("YouTube Download")
-        self.logger = logging.getLogger("similubot.progress.youtube")
+        self.logger = _progress_logger
         self.total_size: Optional[int] = None
-        self.start_time: Optional[float] = None
+        self.start_time_ns: Optional[int] = None
+        # Throttle state: pytubefix fires the callback per chunk, so
+        # formatting/dispatch is rate-limited to ~4 Hz or 1% steps.
+        # Timestamps use monotonic_ns - integer diffs, immune to clock steps.
+        self._last_emit_ns = 0
+        self._last_pct = -1.0
 
     def set_total_size(self, total_size: int) -> None:
         """
@@ -37,7 +49,7 @@ class YouTubeProgressTracker(ProgressTracker):
             total_size: Total file size in bytes
         """
         self.total_size = total_size
-        self.start_time = time.time()
+        self.start_time_ns = time.monotonic_ns()
 
     def update_download_progress(self, downloaded: int, total_size: int) -> None:
         """
@@ -53,13 +65,23 @@ class YouTubeProgressTracker(ProgressTracker):
         # Calculate percentage
         percentage = (downloaded / total_size) * 100
 
+        # Skip the formatting and callback dispatch entirely unless enough
+        # time or progress has passed (completion always emits)
+        now_ns = time.monotonic_ns()
+        if (downloaded != total_size
+                and now_ns - self._last_emit_ns < 250_000_000
+                and percentage - self._last_pct < 1.0):
+            return
+        self._last_emit_ns = now_ns
+        self._last_pct = percentage
+
         # Calculate speed and ETA
         speed = None
         eta = None
-        if self.start_time:
-            elapsed = time.time() - self.start_time
-            if elapsed > 0:
-                speed = downloaded / elapsed  # bytes per second
+        if self.start_time_ns:
+            elapsed_ns = now_ns - self.start_time_ns
+            if elapsed_ns > 0:
+                speed = downloaded * 1_000_000_000 / elapsed_ns  # bytes per second
                 if speed > 0:
                     remaining_bytes = total_size - downloaded
                     eta = remaining_bytes / speed
@@ -125,6 +147,31 @@ class YouTubeClient:
     with progress tracking, error handling, and PoToken support for bot detection bypass.
     """
 
+    # The four accepted URL shapes combined into one precompiled alternation
+    # (watch, short link, embed, /v/), so validation is a single match
+    _YT_URL_RE = re.compile(
+        r'(?:https?://)?(?:www\.)?'
+        r'(?:youtube\.com/(?:watch\?v=|embed/|v/)|youtu\.be/)[\w-]+'
+    )
+
+    # TTL and size cap for the YouTube object cache: extract_audio_info
+    # followed by download_audio for the same URL reuses one metadata fetch
+    _YT_CACHE_TTL = 60.0  # seconds
+    _YT_CACHE_MAX = 32
+
+    # Translation table mapping filesystem-invalid characters to '_',
+    # applied in a single C-level pass by str.translate
+    _SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+    # Lowercased substrings that mark a pytubefix bot-detection failure
+    _BOT_DETECTION_INDICATORS = frozenset({
+        "detected as a bot",
+        "use `use_po_token=true`",
+        "switch to web client",
+        "bot detection",
+        "http error 403",
+    })
+
     def __init__(self, temp_dir: str = "./temp", config: Optional[ConfigManager] = None):
         """
         Initialize the YouTube client.
@@ -133,18 +180,20 @@ class YouTubeClient:
             temp_dir: Directory for temporary audio files
             config: Configuration manager for PoToken settings
         """
-        self.logger = logging.getLogger("similubot.music.youtube_client")
+        self.logger = _logger
         self.temp_dir = temp_dir
         self.config = config
 
-        # Ensure temp directory exists
-        if not os.path.exists(temp_dir):
-            os.makedirs(temp_dir)
-            self.logger.debug(f"Created temp directory: {temp_dir}")
+        # Ensure temp directory exists (exist_ok avoids the stat+mkdir race)
+        os.makedirs(temp_dir, exist_ok=True)
+        self.logger.debug("Ensured temp directory exists: %s", temp_dir)
+
+        # Attempt index that last got past bot detection (0 = default
+        # settings); later requests start there and skip known-bad methods
+        self._last_successful_attempt: int = 0
 
-        # PoToken configuration
-        self._potoken_cache: Dict[str, Any] = {}
-        self._last_successful_method: Optional[str] = None
+        # Recently created YouTube objects keyed by URL (LRU with TTL)
+        self._yt_cache: "OrderedDict[str, Tuple[float, YouTube]]" = OrderedDict()
 
         # Log PoToken configuration status
         if self.config:
@@ -169,14 +218,7 @@ class YouTubeClient:
         Returns:
             True if valid YouTube URL, False otherwise
         """
-        youtube_patterns = [
-            r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtu\.be/[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtube\.com/embed/[\w-]+',
-            r'(?:https?://)?(?:www\.)?youtube\.com/v/[\w-]+'
-        ]
-
-        return any(re.match(pattern, url) for pattern in youtube_patterns)
+        return self._YT_URL_RE.match(url) is not None
 
     def _is_bot_detection_error(self, error_message: str) -> bool:
         """
@@ -188,16 +230,8 @@ class YouTubeClient:
         Returns:
             True if the error indicates bot detection, False otherwise
         """
-        bot_detection_indicators = [
-            "detected as a bot",
-            "Use `use_po_token=True`",
-            "switch to WEB client",
-            "bot detection",
-            "HTTP Error 403"
-        ]
-
         error_lower = error_message.lower()
-        return any(indicator.lower() in error_lower for indicator in bot_detection_indicators)
+        return any(indicator in error_lower for indicator in self._BOT_DETECTION_INDICATORS)
 
     def _get_youtube_kwargs(self, url: str, attempt: int = 0) -> Dict[str, Any]:
         """
@@ -221,7 +255,7 @@ class YouTubeClient:
                 # Use auto PoToken generation with configured client
                 client = self.config.get_potoken_client()
                 kwargs['client'] = client
-                self.logger.debug(f"Using client '{client}' with auto PoToken generation")
+                self.logger.debug("Using client %r with auto PoToken generation", client)
             elif self.config.is_potoken_enabled():
                 # Use manual PoToken if configured
                 visitor_data = self.config.get_manual_visitor_data()
@@ -261,25 +295,49 @@ class YouTubeClient:
         Returns:
             YouTube object if successful, None otherwise
         """
+        # Reuse a recently created object for the same URL; registering the
+        # progress callback on it avoids a second metadata fetch
+        if attempt == 0:
+            cached = self._yt_cache.get(url)
+            if cached:
+                timestamp, yt = cached
+                if time.monotonic() - timestamp < self._YT_CACHE_TTL:
+                    self._yt_cache.move_to_end(url)
+                    if on_progress_callback:
+                        yt.register_on_progress_callback(on_progress_callback)
+                    self.logger.debug("Reusing cached YouTube object for: %s", url)
+                    return yt
+                del self._yt_cache[url]
+
+            # Start from the method that last worked instead of re-paying
+            # the failed-attempt roundtrips on every request
+            if self._last_successful_attempt > 0:
+                attempt = self._last_successful_attempt
+
         kwargs = self._get_youtube_kwargs(url, attempt)
 
         if on_progress_callback:
             kwargs['on_progress_callback'] = on_progress_callback
 
         try:
-            self.logger.debug(f"Creating YouTube object (attempt {attempt + 1}) with kwargs: {list(kwargs.keys())}")
+            self.logger.debug("Creating YouTube object (attempt %d) with kwargs: %s", attempt + 1, list(kwargs))
             yt = await asyncio.to_thread(YouTube, url, **kwargs)
 
-            # Cache successful method for future use
-            if attempt > 0:
-                self._last_successful_method = f"attempt_{attempt}"
-                self.logger.info(f"Successfully bypassed bot detection using attempt {attempt + 1}")
+            # Remember which attempt worked for future use
+            if attempt != self._last_successful_attempt:
+                self._last_successful_attempt = attempt
+                if attempt > 0:
+                    self.logger.info(f"Successfully bypassed bot detection using attempt {attempt + 1}")
+
+            self._yt_cache[url] = (time.monotonic(), yt)
+            if len(self._yt_cache) > self._YT_CACHE_MAX:
+                self._yt_cache.popitem(last=False)
 
             return yt
 
         except PytubeFixError as e:
             error_msg = str(e)
-            self.logger.debug(f"YouTube object creation failed (attempt {attempt + 1}): {error_msg}")
+            self.logger.debug("YouTube object creation failed (attempt %d): %s", attempt + 1, error_msg)
 
             # Check if this is a bot detection error and we should try fallback
             if self._is_bot_detection_error(error_msg) and self.config and self.config.is_youtube_auto_fallback_enabled():
@@ -306,7 +364,7 @@ class YouTubeClient:
             return None
 
         try:
-            self.logger.debug(f"Extracting info from: {url}")
+            self.logger.debug("Extracting info from: %s", url)
 
             # Create YouTube object with bot detection handling
             yt = await self._create_youtube_object(url)
@@ -314,19 +372,27 @@ class YouTubeClient:
                 self.logger.error(f"Failed to create YouTube object for: {url}")
                 return None
 
-            # Get audio stream info
-            audio_stream = yt.streams.get_audio_only()
-            if not audio_stream:
+            # Stream selection and metadata properties lazily fetch and
+            # parse video data in pytubefix, so batch them in one worker
+            # thread instead of blocking the event loop per attribute
+            def _read_metadata():
+                if not yt.streams.get_audio_only():
+                    return None
+                return yt.title, yt.length, yt.author, yt.thumbnail_url
+
+            metadata = await asyncio.to_thread(_read_metadata)
+            if metadata is None:
                 self.logger.error(f"No audio stream found for: {url}")
                 return None
 
+            title, length, author, thumbnail_url = metadata
             return AudioInfo(
-                title=yt.title or "Unknown Title",
-                duration=yt.length or 0,
+                title=title or "Unknown Title",
+                duration=length or 0,
                 file_path="",  # Will be set during download
                 url=url,
-                uploader=yt.author or "Unknown",
-                thumbnail_url=yt.thumbnail_url
+                uploader=author or "Unknown",
+                thumbnail_url=thumbnail_url
             )
 
         except PytubeFixError as e:
@@ -382,21 +448,23 @@ class YouTubeClient:
                 progress_tracker.fail("Failed to create YouTube object")
                 return False, None, "Failed to create YouTube object"
 
-            # Get best audio stream (prefer M4A format)
-            audio_stream = yt.streams.filter(only_audio=True, file_extension='m4a').first()
+            # Get best audio stream (prefer M4A format, fall back to any
+            # audio stream); stream selection parses the format table and
+            # can fetch video data, so keep it off the event loop
+            audio_stream = await asyncio.to_thread(
+                lambda: yt.streams.filter(only_audio=True, file_extension='m4a').first()
+                or yt.streams.get_audio_only()
+            )
             if not audio_stream:
-                # Fallback to any audio stream
-                audio_stream = yt.streams.get_audio_only()
-                if not audio_stream:
-                    progress_tracker.fail("No audio stream available")
-                    return False, None, "No audio stream available"
+                progress_tracker.fail("No audio stream available")
+                return False, None, "No audio stream available"
 
             # Generate safe filename
             safe_title = self._sanitize_filename(yt.title or "audio")
             filename = f"{safe_title}.{audio_stream.subtype}"
 
             # Download audio
-            self.logger.debug(f"Downloading to: {self.temp_dir}/{filename}")
+            self.logger.debug("Downloading to: %s/%s", self.temp_dir, filename)
             file_path = await asyncio.to_thread(
                 audio_stream.download,
                 output_path=self.temp_dir,
@@ -453,9 +521,7 @@ class YouTubeClient:
             Sanitized filename
         """
         # Remove or replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
+        filename = filename.translate(self._SANITIZE_TABLE)
 
         # Limit length and strip whitespace
         filename = filename.strip()[:100]
@@ -479,7 +545,7 @@ class YouTubeClient:
         try:
             if os.path.exists(file_path):
                 os.remove(file_path)
-                self.logger.debug(f"Cleaned up file: {file_path}")
+                self.logger.debug("Cleaned up file: %s", file_path)
                 return True
             return False
         except Exception as e:
@@ -496,10 +562,16 @@ class YouTubeClient:
         Returns:
             Formatted duration string
         """
-        if seconds < 3600:  # Less than 1 hour
-            minutes, secs = divmod(seconds, 60)
-            return f"{minutes:02d}:{secs:02d}"
-        else:  # 1 hour or more
-            hours, remainder = divmod(seconds, 3600)
-            minutes, secs = divmod(remainder, 60)
-            return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        return _format_duration_cached(seconds)
+
+
+@lru_cache(maxsize=4096)
+def _format_duration_cached(seconds: int) -> str:
+    """Format and memoize a duration - queue displays repeat the same values."""
+    if seconds < 3600:  # Less than 1 hour
+        minutes, secs = divmod(seconds, 60)
+        return f"{minutes:02d}:{secs:02d}"
+    else:  # 1 hour or more
+        hours, remainder = divmod(seconds, 3600)
+        minutes, secs = divmod(remainder, 60)
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
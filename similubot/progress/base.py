@@ -75,6 +75,7 @@ class ProgressTracker(ABC):
         self.callbacks: list[ProgressCallback] = []
         self.current_progress: Optional[ProgressInfo] = None
         self.start_time: Optional[float] = None
+        self._last_emitted_pct: Optional[float] = None
 
     def add_callback(self, callback: ProgressCallback) -> None:
         """
@@ -115,6 +116,7 @@ class ProgressTracker(ABC):
     def start(self) -> None:
         """Start tracking progress."""
         self.start_time = time.time()
+        self._last_emitted_pct = None
         progress = ProgressInfo(
             operation=self.operation_name,
             status=ProgressStatus.STARTING,
@@ -144,6 +146,20 @@ class ProgressTracker(ABC):
             details: Additional operation-specific details
             eta: Estimated time remaining in seconds (optional, calculated if not provided)
         """
+        # Coalesce high-frequency updates: skip callback dispatch when the
+        # percentage moved less than the emit threshold since the last
+        # in-progress update (callbacks may do network-bound work such as
+        # editing a Discord message). Terminal states always emit.
+        if (
+            percentage is not None
+            and self._last_emitted_pct is not None
+            and percentage < 100.0
+            and abs(percentage - self._last_emitted_pct) < 5.0
+        ):
+            return
+        if percentage is not None:
+            self._last_emitted_pct = percentage
+
         # Calculate ETA if not provided and we have speed and remaining size
         if eta is None and speed and speed > 0 and total_size and current_size:
             remaining_size = total_size - current_size
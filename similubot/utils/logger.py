@@ -1,10 +1,98 @@
 """Logging utility for SimiluBot."""
+import atexit
 import logging
+import logging.config
 import os
-import sys
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
+# Skip collecting record fields the format string never uses - each one
+# costs a syscall or lookup per log call
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Shared by the console and file handlers; validate=False skips the
+# style check since the format string is a constant
+_LOG_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S',
+    validate=False
+)
+
+
+class _BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler without the per-record flush.
+
+    The stdlib handler flushes after every record, costing a write
+    syscall per log line. Records here reach the OS through normal stdio
+    buffering instead; the buffer is flushed when the file rolls over,
+    on close, and at interpreter exit (setup_logger registers close with
+    atexit).
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _QueuedFileHandler(QueueHandler):
+    """
+    QueueHandler that owns the listener thread feeding the file handler.
+
+    Log calls only enqueue the record, so they never block on disk; the
+    listener drains the queue on a background thread into the rotating
+    file handler. close() stops the listener (flushing anything queued)
+    and closes the target before releasing the handler itself.
+    """
+
+    def __init__(self, record_queue: "queue.SimpleQueue", listener: QueueListener):
+        super().__init__(record_queue)
+        self.listener: Optional[QueueListener] = listener
+
+    def close(self) -> None:
+        listener, self.listener = self.listener, None
+        if listener is not None:
+            listener.stop()
+            for target in listener.handlers:
+                target.close()
+        super().close()
+
+
+# The handler from the most recent setup_logger call; closed before a new
+# one is created so repeated setups don't leak listener threads
+_active_file_handler: Optional[_QueuedFileHandler] = None
+
+
+def _queued_file_handler(**kwargs) -> _QueuedFileHandler:
+    """Build the queue handler/listener pair around a rotating file handler."""
+    global _active_file_handler
+    if _active_file_handler is not None:
+        _active_file_handler.close()
+
+    # The formatter lives on the target so records are formatted once,
+    # on the listener thread rather than the logging call site
+    target = _BufferedRotatingFileHandler(**kwargs)
+    target.setFormatter(_LOG_FORMATTER)
+
+    record_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+    listener = QueueListener(record_queue, target)
+    listener.start()
+
+    _active_file_handler = _QueuedFileHandler(record_queue, listener)
+    return _active_file_handler
+
+
 def setup_logger(
     log_level: str = "INFO",
     log_file: Optional[str] = None,
@@ -23,60 +111,78 @@ def setup_logger(
     Raises:
         ValueError: If an invalid log level is provided
     """
-    # Validate log level
+    # Validate log level and resolve it to its numeric value once, using
+    # the name-to-level mapping stdlib logging already maintains
     log_level = log_level.upper()
-    if not hasattr(logging, log_level):
+    level = logging.getLevelName(log_level)
+    if not isinstance(level, int):
         raise ValueError(f"Invalid log level: {log_level}. Must be one of: DEBUG, INFO, WARNING, ERROR, CRITICAL")
 
-    # Create logger
-    logger = logging.getLogger("similubot")
-
-    # Clear existing handlers to avoid duplicates
-    logger.handlers.clear()
-
-    # Set log level
-    logger.setLevel(getattr(logging, log_level))
-
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, log_level))
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    # Build the configuration declaratively; dictConfig replaces the
+    # existing handlers in one pass, so no manual clearing is needed
+    handlers: dict = {
+        "console": {
+            "class": "logging.StreamHandler",
+            "level": level,
+            "formatter": "standard",
+            "stream": "ext://sys.stdout",
+        }
+    }
+    logger_handlers = ["console"]
+    file_error: Optional[OSError] = None
 
-    # Create file handler if log_file is specified
     if log_file:
         try:
-            # Ensure log directory exists
+            # Ensure log directory exists (exist_ok avoids the stat+mkdir race)
             log_dir = os.path.dirname(log_file)
-            if log_dir and not os.path.exists(log_dir):
+            if log_dir:
                 os.makedirs(log_dir, exist_ok=True)
 
-            file_handler = RotatingFileHandler(
-                log_file,
-                maxBytes=max_size,
-                backupCount=backup_count,
-                encoding='utf-8'
-            )
-            file_handler.setLevel(getattr(logging, log_level))
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            # delay=True defers opening the file until the first record;
+            # no formatter here - the listener's target formats instead
+            handlers["file"] = {
+                "()": _queued_file_handler,
+                "level": level,
+                "filename": log_file,
+                "maxBytes": max_size,
+                "backupCount": backup_count,
+                "encoding": "utf-8",
+                "delay": True,
+            }
+            logger_handlers.append("file")
+        except (OSError, IOError) as e:
+            file_error = e
 
-            # Log setup confirmation to file
-            logger.debug(f"File logging enabled: {log_file}")
+    logging.config.dictConfig({
+        "version": 1,
+        "disable_existing_loggers": False,
+        # Reuse the shared module-level formatter instance
+        "formatters": {"standard": {"()": lambda: _LOG_FORMATTER}},
+        "handlers": handlers,
+        "loggers": {
+            "similubot": {
+                "level": level,
+                "handlers": logger_handlers,
+                # Prevent propagation to root logger to avoid duplicates
+                "propagate": False,
+            }
+        },
+    })
 
-        except (OSError, IOError) as e:
-            # If file logging fails, log to console only
-            logger.warning(f"Failed to set up file logging to {log_file}: {e}")
-            logger.warning("Continuing with console logging only")
+    logger = logging.getLogger("similubot")
+
+    if file_error is not None:
+        # If file logging fails, log to console only
+        logger.warning(f"Failed to set up file logging to {log_file}: {file_error}")
+        logger.warning("Continuing with console logging only")
+    elif log_file:
+        # Stop the listener and flush the file buffer at interpreter exit
+        for handler in logger.handlers:
+            if isinstance(handler, _QueuedFileHandler):
+                atexit.register(handler.close)
 
-    # Prevent propagation to root logger to avoid duplicate messages
-    logger.propagate = False
+        # Log setup confirmation to file
+        logger.debug(f"File logging enabled: {log_file}")
 
     # Log debug message to confirm logger setup
     logger.debug(f"Logger initialized - Level: {log_level}, File: {log_file or 'Console only'}")
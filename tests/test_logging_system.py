@@ -4,171 +4,190 @@ Test suite for the logging system functionality.
 Tests the logger setup with configuration values and ensures proper
 file and console logging behavior.
 """
+import io
 import logging
+import logging.handlers
 import os
-import tempfile
-import unittest
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 from similubot.utils.logger import setup_logger
-from similubot.utils.config_manager import ConfigManager
-
-
-class TestLoggingSystem(unittest.TestCase):
-    """Test cases for the logging system."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        # Clear any existing handlers
-        logger = logging.getLogger("similubot")
-        logger.handlers.clear()
-        
-    def tearDown(self):
-        """Clean up after tests."""
-        # Close and clear handlers after each test
-        logger = logging.getLogger("similubot")
-        for handler in logger.handlers:
-            handler.close()
-        logger.handlers.clear()
-
-    def test_setup_logger_with_defaults(self):
-        """Test logger setup with default parameters."""
+
+
+# Resolved once at import; getLogger is idempotent, so every later
+# lookup would just re-take the logging lock to return the same object
+LOG = logging.getLogger("similubot")
+
+
+@pytest.fixture(scope="module")
+def similubot_logger():
+    """Hand tests the application logger resolved at import time."""
+    return LOG
+
+
+@pytest.fixture(scope="session")
+def log_tmp(tmp_path_factory):
+    """One temporary directory shared by all file-logging tests."""
+    return tmp_path_factory.mktemp("logs")
+
+
+@pytest.fixture(autouse=True)
+def _reset_handlers(similubot_logger):
+    """Give each test a clean handler list and close handlers afterwards."""
+    similubot_logger.handlers.clear()
+    yield
+    # Pop-and-close empties the list in one pass
+    handlers = similubot_logger.handlers
+    while handlers:
+        handlers.pop().close()
+
+
+def test_setup_logger_with_defaults(similubot_logger):
+    """Test logger setup with default parameters."""
+    setup_logger()
+
+    # Check that console handler is added
+    assert len(similubot_logger.handlers) == 1
+    assert isinstance(similubot_logger.handlers[0], logging.StreamHandler)
+
+    # Check that propagation is disabled
+    assert not similubot_logger.propagate
+
+
+@pytest.mark.parametrize("level,expected", [
+    ("DEBUG", logging.DEBUG),
+    ("debug", logging.DEBUG),
+    (None, logging.INFO),
+])
+def test_setup_logger_level(level, expected, similubot_logger):
+    """Test that the requested level is applied, case-insensitively."""
+    if level is None:
         setup_logger()
-        
-        logger = logging.getLogger("similubot")
-        
-        # Check logger level
-        self.assertEqual(logger.level, logging.INFO)
-        
-        # Check that console handler is added
-        self.assertEqual(len(logger.handlers), 1)
-        self.assertIsInstance(logger.handlers[0], logging.StreamHandler)
-        
-        # Check that propagation is disabled
-        self.assertFalse(logger.propagate)
-
-    def test_setup_logger_with_debug_level(self):
-        """Test logger setup with DEBUG level."""
-        setup_logger(log_level="DEBUG")
-        
-        logger = logging.getLogger("similubot")
-        
-        # Check logger level
-        self.assertEqual(logger.level, logging.DEBUG)
-
-    def test_setup_logger_with_file_logging(self):
-        """Test logger setup with file logging."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = os.path.join(temp_dir, "test.log")
-
-            setup_logger(log_level="INFO", log_file=log_file)
-
-            logger = logging.getLogger("similubot")
-
-            # Check that both console and file handlers are added
-            self.assertEqual(len(logger.handlers), 2)
-
-            # Test logging to file
-            logger.info("Test message")
-
-            # Close handlers before checking file
-            for handler in logger.handlers:
-                handler.close()
-            logger.handlers.clear()
-
-            # Check that file was created and contains the message
-            self.assertTrue(os.path.exists(log_file))
-            with open(log_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                self.assertIn("Test message", content)
-
-    def test_setup_logger_invalid_level(self):
-        """Test logger setup with invalid log level."""
-        with self.assertRaises(ValueError) as context:
-            setup_logger(log_level="INVALID")
-        
-        self.assertIn("Invalid log level: INVALID", str(context.exception))
-
-    def test_setup_logger_case_insensitive_level(self):
-        """Test logger setup with case insensitive log level."""
-        setup_logger(log_level="debug")
-        
-        logger = logging.getLogger("similubot")
-        self.assertEqual(logger.level, logging.DEBUG)
-
-    def test_setup_logger_creates_log_directory(self):
-        """Test that logger creates log directory if it doesn't exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            log_file = os.path.join(temp_dir, "subdir", "test.log")
-
-            # Ensure subdirectory doesn't exist
-            self.assertFalse(os.path.exists(os.path.dirname(log_file)))
-
-            setup_logger(log_file=log_file)
-
-            # Check that directory was created
-            self.assertTrue(os.path.exists(os.path.dirname(log_file)))
-
-            # Close handlers before cleanup
-            logger = logging.getLogger("similubot")
-            for handler in logger.handlers:
-                handler.close()
-            logger.handlers.clear()
-
-    def test_setup_logger_handles_file_permission_error(self):
-        """Test logger gracefully handles file permission errors."""
-        # Try to write to a location that should fail (root directory on most systems)
-        invalid_path = "/root/test.log" if os.name != 'nt' else "C:\\Windows\\System32\\test.log"
-        
+    else:
+        setup_logger(log_level=level)
+
+    assert similubot_logger.level == expected
+
+
+def test_setup_logger_with_file_logging(similubot_logger, log_tmp, request):
+    """Test logger setup with file logging."""
+    log_file = str(log_tmp / f"{request.node.name}.log")
+
+    setup_logger(log_level="INFO", log_file=log_file)
+
+    # Check that both console and file handlers are added, and that the
+    # file side is queue-fronted so log calls never block on disk
+    assert len(similubot_logger.handlers) == 2
+    assert isinstance(similubot_logger.handlers[1], logging.handlers.QueueHandler)
+
+    # Test logging to file
+    similubot_logger.info("Test message")
+
+    # Close handlers before checking file (stops the queue listener,
+    # which flushes pending records to the file)
+    handlers = similubot_logger.handlers
+    while handlers:
+        handlers.pop().close()
+
+    # Check that file was created and contains the message
+    assert os.path.exists(log_file)
+    with open(log_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+        assert "Test message" in content
+
+
+def test_logger_emits_to_memory_stream(similubot_logger):
+    """Test log emission and formatting through an in-memory stream.
+
+    Checks the record path without the disk round-trip; the file test
+    above remains the single test exercising the real file handler.
+    """
+    setup_logger(log_level="INFO")
+
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(similubot_logger.handlers[0].formatter)
+    similubot_logger.addHandler(handler)
+
+    similubot_logger.info("Test message")
+
+    content = stream.getvalue()
+    assert "Test message" in content
+    assert "similubot" in content
+    assert "INFO" in content
+
+
+def test_setup_logger_invalid_level():
+    """Test logger setup with invalid log level."""
+    with pytest.raises(ValueError) as exc_info:
+        setup_logger(log_level="INVALID")
+
+    assert "Invalid log level: INVALID" in str(exc_info.value)
+
+
+def test_setup_logger_creates_log_directory(similubot_logger):
+    """Test that logger creates the log directory if it doesn't exist."""
+    # Record the directory-creation call instead of touching the real
+    # filesystem; the deferred file handler never opens the file either,
+    # so the whole test runs without disk I/O
+    with patch('similubot.utils.logger.os.makedirs') as mock_makedirs:
+        setup_logger(log_file="/fake/subdir/test.log")
+
+    mock_makedirs.assert_called_once_with("/fake/subdir", exist_ok=True)
+
+
+def test_setup_logger_handles_file_permission_error(similubot_logger):
+    """Test logger gracefully handles file permission errors."""
+    # Mock the directory creation failure instead of poking a real
+    # privileged path, which succeeds when the suite runs as root
+    with patch('similubot.utils.logger.os.makedirs', side_effect=PermissionError("denied")):
         # This should not raise an exception, but log a warning
-        setup_logger(log_file=invalid_path)
-        
-        logger = logging.getLogger("similubot")
-        
-        # Should only have console handler
-        self.assertEqual(len(logger.handlers), 1)
-        self.assertIsInstance(logger.handlers[0], logging.StreamHandler)
-
-    @patch('similubot.utils.config_manager.ConfigManager')
-    def test_config_manager_integration(self, mock_config_class):
-        """Test integration with ConfigManager."""
-        # Mock config manager
-        mock_config = MagicMock()
-        mock_config.get_log_level.return_value = "DEBUG"
-        mock_config.get_log_file.return_value = None
-        mock_config.get_log_max_size.return_value = 5242880  # 5 MB
-        mock_config.get_log_backup_count.return_value = 3
-        mock_config_class.return_value = mock_config
-        
-        # Test that config values are used
-        config = ConfigManager()
-        setup_logger(
-            log_level=config.get_log_level(),
-            log_file=config.get_log_file(),
-            max_size=config.get_log_max_size(),
-            backup_count=config.get_log_backup_count()
-        )
-        
-        logger = logging.getLogger("similubot")
-        self.assertEqual(logger.level, logging.DEBUG)
-
-    def test_multiple_setup_calls_clear_handlers(self):
-        """Test that multiple setup calls don't create duplicate handlers."""
-        # First setup
-        setup_logger(log_level="INFO")
-        logger = logging.getLogger("similubot")
-        initial_handler_count = len(logger.handlers)
-        
-        # Second setup
-        setup_logger(log_level="DEBUG")
-        final_handler_count = len(logger.handlers)
-        
-        # Should have same number of handlers
-        self.assertEqual(initial_handler_count, final_handler_count)
-        
-        # Level should be updated
-        self.assertEqual(logger.level, logging.DEBUG)
-
-
-if __name__ == '__main__':
-    unittest.main()
+        setup_logger(log_file="/fake/subdir/test.log")
+
+    # Should only have console handler
+    assert len(similubot_logger.handlers) == 1
+    assert isinstance(similubot_logger.handlers[0], logging.StreamHandler)
+
+
+@patch('similubot.utils.config_manager.ConfigManager')
+def test_config_manager_integration(mock_config_class, similubot_logger):
+    """Test integration with ConfigManager."""
+    # Imported lazily - only this test needs the config machinery
+    from similubot.utils.config_manager import ConfigManager
+
+    # Mock config manager
+    mock_config = MagicMock()
+    mock_config.get_log_level.return_value = "DEBUG"
+    mock_config.get_log_file.return_value = None
+    mock_config.get_log_max_size.return_value = 5242880  # 5 MB
+    mock_config.get_log_backup_count.return_value = 3
+    mock_config_class.return_value = mock_config
+
+    # Test that config values are used
+    config = ConfigManager()
+    setup_logger(
+        log_level=config.get_log_level(),
+        log_file=config.get_log_file(),
+        max_size=config.get_log_max_size(),
+        backup_count=config.get_log_backup_count()
+    )
+
+    assert similubot_logger.level == logging.DEBUG
+
+
+def test_multiple_setup_calls_clear_handlers(similubot_logger):
+    """Test that multiple setup calls don't create duplicate handlers."""
+    # First setup
+    setup_logger(log_level="INFO")
+    initial_handler_count = len(similubot_logger.handlers)
+
+    # Second setup
+    setup_logger(log_level="DEBUG")
+    final_handler_count = len(similubot_logger.handlers)
+
+    # Should have same number of handlers
+    assert initial_handler_count == final_handler_count
+
+    # Level should be updated
+    assert similubot_logger.level == logging.DEBUG
@@ -1,151 +1,170 @@
 """Comprehensive tests for MEGA functionality."""
-import unittest
-import tempfile
-import os
-import sys
-from unittest.mock import MagicMock, patch, AsyncMock
-import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
-# Add the project root to the path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
 
 from similubot.downloaders.mega_downloader import MegaDownloader
 from similubot.converters.audio_converter import AudioConverter
 from similubot.commands.mega_commands import MegaCommands
+from similubot.core.command_registry import CommandRegistry
+from similubot.uploaders.catbox_uploader import CatboxUploader
+from similubot.uploaders.discord_uploader import DiscordUploader
+from similubot.utils.config_manager import ConfigManager
+
+
+@pytest.fixture(scope="module")
+def run_patch():
+    """Patch subprocess.run once for the whole module."""
+    with patch('similubot.downloaders.mega_downloader.subprocess.run') as mock_run:
+        yield mock_run
+
+
+@pytest.fixture
+def mock_run(run_patch):
+    """Hand each test the shared subprocess mock in a clean state."""
+    run_patch.reset_mock(return_value=True, side_effect=True)
+    return run_patch
+
+
+@pytest.fixture(scope="module")
+def downloader():
+    """Shared downloader with the availability check disabled.
+
+    Its construction does no probing, so one instance serves every test.
+    """
+    return MegaDownloader(check_availability=False)
+
+
+def test_downloader_initialization(downloader):
+    """Test MEGA downloader initialization."""
+    assert downloader is not None
+
+
+def test_downloader_availability_disabled(downloader):
+    """Test MEGA downloader with availability check disabled."""
+    assert not downloader.is_available()
+
+
+def test_downloader_availability_enabled_success(mock_run):
+    """Test MEGA downloader with successful availability check."""
+    # Mock successful MegaCMD check
+    mock_run.return_value.returncode = 0
+    mock_run.return_value.stdout = "MEGAcmd version 1.6.3"
+
+    downloader = MegaDownloader(check_availability=True)
+    assert downloader.is_available()
+
+
+def test_downloader_availability_enabled_failure(mock_run):
+    """Test MEGA downloader with failed availability check."""
+    # Mock failed MegaCMD check
+    mock_run.side_effect = FileNotFoundError("MegaCMD not found")
+
+    downloader = MegaDownloader(check_availability=True)
+    assert not downloader.is_available()
+
+
+def test_converter_initialization():
+    """Test audio converter initialization."""
+    assert AudioConverter() is not None
+
+
+@pytest.fixture(scope="module")
+def mega_env():
+    """Build the mock dependencies and both command instances once.
+
+    Spec-restricted Mocks skip MagicMock's magic-method factories and
+    catch typoed attribute access; the instances are shared across
+    tests and reset per test in mega_cmds.
+    """
+    env = SimpleNamespace(
+        config=Mock(spec=ConfigManager),
+        downloader=Mock(spec=MegaDownloader),
+        converter=Mock(spec=AudioConverter),
+        catbox_uploader=Mock(spec=CatboxUploader),
+        discord_uploader=Mock(spec=DiscordUploader),
+    )
+
+    env.commands = MegaCommands(
+        config=env.config,
+        downloader=env.downloader,
+        converter=env.converter,
+        catbox_uploader=env.catbox_uploader,
+        discord_uploader=env.discord_uploader
+    )
+
+    # Shared instance for the downloader=None cases
+    env.unavailable_commands = MegaCommands(
+        config=env.config,
+        downloader=None,
+        converter=env.converter,
+        catbox_uploader=env.catbox_uploader,
+        discord_uploader=env.discord_uploader
+    )
+
+    return env
+
+
+@pytest.fixture
+def mega_cmds(mega_env):
+    """Reset the shared mocks and re-apply baseline behavior."""
+    for mock in (mega_env.config, mega_env.downloader, mega_env.converter,
+                 mega_env.catbox_uploader, mega_env.discord_uploader):
+        mock.reset_mock(return_value=True, side_effect=True)
+
+    mega_env.config.get_mega_upload_service.return_value = "catbox"
+    mega_env.config.get_default_bitrate.return_value = 128
+    mega_env.downloader.is_available.return_value = True
+
+    return mega_env
+
+
+def test_mega_commands_initialization(mega_cmds):
+    """Test MEGA commands initialization."""
+    assert mega_cmds.commands is not None
+
+
+@pytest.mark.parametrize("case,expected", [
+    ("downloader_available", True),
+    ("no_downloader", False),
+    ("downloader_unavailable", False),
+])
+def test_mega_commands_availability(mega_cmds, case, expected):
+    """Table-driven availability checks for each downloader state."""
+    if case == "no_downloader":
+        commands = mega_cmds.unavailable_commands
+    else:
+        if case == "downloader_unavailable":
+            mega_cmds.downloader.is_available.return_value = False
+        commands = mega_cmds.commands
+
+    assert bool(commands.is_available()) == expected
+
 
+def test_mega_commands_registration_when_available(mega_cmds):
+    """Test MEGA commands registration when available."""
+    # Create mock registry
+    mock_registry = Mock(spec=CommandRegistry)
+
+    # Register commands
+    mega_cmds.commands.register_commands(mock_registry)
 
-class TestMegaDownloader(unittest.TestCase):
-    """Test MEGA downloader functionality."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        # Test with availability check disabled to avoid MegaCMD dependency
-        self.downloader = MegaDownloader(check_availability=False)
-
-    def test_downloader_initialization(self):
-        """Test MEGA downloader initialization."""
-        self.assertIsNotNone(self.downloader)
-
-    def test_downloader_availability_disabled(self):
-        """Test MEGA downloader with availability check disabled."""
-        downloader = MegaDownloader(check_availability=False)
-        self.assertFalse(downloader.is_available())
-
-    @patch('similubot.downloaders.mega_downloader.subprocess.run')
-    def test_downloader_availability_enabled_success(self, mock_run):
-        """Test MEGA downloader with successful availability check."""
-        # Mock successful MegaCMD check
-        mock_run.return_value.returncode = 0
-        mock_run.return_value.stdout = "MEGAcmd version 1.6.3"
-
-        downloader = MegaDownloader(check_availability=True)
-        self.assertTrue(downloader.is_available())
-
-    @patch('similubot.downloaders.mega_downloader.subprocess.run')
-    def test_downloader_availability_enabled_failure(self, mock_run):
-        """Test MEGA downloader with failed availability check."""
-        # Mock failed MegaCMD check
-        mock_run.side_effect = FileNotFoundError("MegaCMD not found")
-
-        downloader = MegaDownloader(check_availability=True)
-        self.assertFalse(downloader.is_available())
-
-
-class TestAudioConverter(unittest.TestCase):
-    """Test audio conversion functionality."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.converter = AudioConverter()
-
-    def test_converter_initialization(self):
-        """Test audio converter initialization."""
-        self.assertIsNotNone(self.converter)
-
-
-class TestMegaCommands(unittest.TestCase):
-    """Test MEGA commands functionality."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create mock dependencies
-        self.mock_config = MagicMock()
-        self.mock_config.get_mega_upload_service.return_value = "catbox"
-        self.mock_config.get_default_bitrate.return_value = 128
-
-        self.mock_downloader = MagicMock()
-        self.mock_downloader.is_available.return_value = True
-        self.mock_converter = MagicMock()
-        self.mock_catbox_uploader = MagicMock()
-        self.mock_discord_uploader = MagicMock()
-
-        self.mega_commands = MegaCommands(
-            config=self.mock_config,
-            downloader=self.mock_downloader,
-            converter=self.mock_converter,
-            catbox_uploader=self.mock_catbox_uploader,
-            discord_uploader=self.mock_discord_uploader
-        )
-
-    def test_mega_commands_initialization(self):
-        """Test MEGA commands initialization."""
-        self.assertIsNotNone(self.mega_commands)
-
-    def test_mega_commands_availability_with_downloader(self):
-        """Test MEGA commands availability when downloader is available."""
-        self.assertTrue(self.mega_commands.is_available())
-
-    def test_mega_commands_availability_without_downloader(self):
-        """Test MEGA commands availability when downloader is None."""
-        mega_commands = MegaCommands(
-            config=self.mock_config,
-            downloader=None,
-            converter=self.mock_converter,
-            catbox_uploader=self.mock_catbox_uploader,
-            discord_uploader=self.mock_discord_uploader
-        )
-        self.assertFalse(mega_commands.is_available())
-
-    def test_mega_commands_availability_with_unavailable_downloader(self):
-        """Test MEGA commands availability when downloader is not available."""
-        self.mock_downloader.is_available.return_value = False
-        self.assertFalse(self.mega_commands.is_available())
-
-    def test_mega_commands_registration_when_available(self):
-        """Test MEGA commands registration when available."""
-        # Create mock registry
-        mock_registry = MagicMock()
-
-        # Register commands
-        self.mega_commands.register_commands(mock_registry)
-
-        # Verify registration was called
-        mock_registry.register_command.assert_called_once()
-        call_args = mock_registry.register_command.call_args[1]
-        self.assertEqual(call_args['name'], 'mega')
-        self.assertIsNotNone(call_args['usage_examples'])
-        self.assertIsNotNone(call_args['help_text'])
-
-    def test_mega_commands_registration_when_unavailable(self):
-        """Test MEGA commands registration when unavailable."""
-        # Create unavailable MEGA commands
-        mega_commands = MegaCommands(
-            config=self.mock_config,
-            downloader=None,
-            converter=self.mock_converter,
-            catbox_uploader=self.mock_catbox_uploader,
-            discord_uploader=self.mock_discord_uploader
-        )
-
-        # Create mock registry
-        mock_registry = MagicMock()
-
-        # Register commands
-        mega_commands.register_commands(mock_registry)
-
-        # Verify registration was NOT called
-        mock_registry.register_command.assert_not_called()
-
-
-if __name__ == "__main__":
-    unittest.main()
+    # Verify registration was called
+    mock_registry.register_command.assert_called_once()
+    kwargs = mock_registry.register_command.call_args.kwargs
+    assert kwargs['name'] == 'mega'
+    assert kwargs['usage_examples'] is not None
+    assert kwargs['help_text'] is not None
+
+
+def test_mega_commands_registration_when_unavailable(mega_cmds):
+    """Test MEGA commands registration when unavailable."""
+    # Create mock registry
+    mock_registry = Mock(spec=CommandRegistry)
+
+    # Register commands
+    mega_cmds.unavailable_commands.register_commands(mock_registry)
+
+    # Verify registration was NOT called
+    mock_registry.register_command.assert_not_called()